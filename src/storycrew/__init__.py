@@ -0,0 +1,31 @@
+"""StoryCrew: generate novels with CrewAI.
+
+The public names below are resolved lazily (PEP 562), so importing the
+package - e.g. for ``python -m storycrew.main --help`` - does not load
+CrewAI until one of the crews is actually used.
+"""
+
+import importlib
+
+_LAZY_ATTRS = {
+    "run": "storycrew.main",
+    "Storycrew": "storycrew.crew",
+    "InitCrew": "storycrew.crews",
+    "ChapterCrew": "storycrew.crews",
+    "FinalCrew": "storycrew.crews",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
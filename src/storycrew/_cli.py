@@ -0,0 +1,113 @@
+"""Command-line entry point for StoryCrew.
+
+Only the standard library is imported here; argument parsing, --help and
+--version never load storycrew.main (and so never load CrewAI).
+"""
+import functools
+import logging
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+
+# Shared, interned genre names: argparse's membership check and run()'s
+# genre comparisons hit the identity fast path
+_GENRE_CHOICES = tuple(sys.intern(genre) for genre in ("romance", "mystery"))
+
+
+def _package_version() -> str:
+    """Installed storycrew version, without importing the package itself."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("storycrew")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> "argparse.ArgumentParser":
+    """Build the CLI parser on first use; later main() calls reuse it."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="StoryCrew: Generate novels with CrewAI"
+    )
+    parser.add_argument(
+        "--genre",
+        type=str,
+        choices=_GENRE_CHOICES,
+        help="Story genre (skip for interactive mode)"
+    )
+    parser.add_argument(
+        "--theme",
+        type=str,
+        help="Core theme of the story (skip for interactive mode)"
+    )
+    parser.add_argument(
+        "--preferences",
+        type=str,
+        default="",
+        help="Additional user preferences"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Base output directory (default: ./novels)"
+    )
+    parser.add_argument(
+        "-V", "--version",
+        action="version",
+        version=f"%(prog)s {_package_version()}"
+    )
+    return parser
+
+
+def main():
+    """
+    Main entry point for command-line usage.
+
+    Interactive mode (default):
+        python -m storycrew.main
+
+    Command-line mode (for scripting):
+        python -m storycrew.main --genre romance --theme "..."
+    """
+    # Answer a bare --version without building (or importing) argparse
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        print(f"storycrew {_package_version()}")
+        return 0
+
+    # --help exits here; CrewAI is only imported once run() starts
+    args = _get_parser().parse_args()
+
+    # Interactive mode if no genre/theme provided
+    if not args.genre or not args.theme:
+        from storycrew._interactive import interactive_input
+        genre, theme, preferences = interactive_input()
+        additional_preferences = preferences or args.preferences
+        base_output_dir = args.output or "./novels"
+    else:
+        # Command-line mode
+        genre = args.genre
+        theme = args.theme
+        additional_preferences = args.preferences
+        base_output_dir = args.output or "./novels"
+
+    # Generation (and CrewAI with it) is only loaded past this point
+    from storycrew.main import run
+
+    try:
+        result = run(
+            genre=genre,
+            theme_statement=theme,
+            additional_preferences=additional_preferences,
+            output_dir=base_output_dir
+        )
+        return 0 if result['success'] else 1
+    except Exception:
+        # Keeps the traceback; goes to the log file too once run() has set up logging
+        logging.getLogger("StoryCrew").exception("CLI run failed")
+        return 1
@@ -0,0 +1,83 @@
+"""Interactive prompts for the storycrew CLI.
+
+Kept out of main.py so scripted runs (--genre/--theme given) never load it.
+"""
+import sys
+
+# All user-facing text lives here, so it's built once per process and can be
+# translated in one place. Fixed blocks go out with a single sys.stdout.write.
+_BANNER = (
+    "=" * 80 + "\n"
+    "StoryCrew - AI小说自动生成系统\n"
+    + "=" * 80 + "\n"
+    "\n"
+    "请选择小说题材：\n"
+    "  1. 都市职场爱情 (romance)\n"
+    "  2. 本格/社会派悬疑 (mystery)\n"
+    "\n"
+)
+_THEME_HEADER = (
+    "请输入小说主题（建议100字左右，描述你想写的故事核心）：\n"
+    "提示：可以是人物关系、核心冲突、或者一句话概括的故事梗概\n"
+    "\n"
+)
+_GENRES = {
+    "1": ("romance", "都市职场爱情"),
+    "2": ("mystery", "本格/社会派悬疑"),
+}
+_PREFERENCES_HEADER = "可选：其他偏好要求（如特定人物设定、故事风格等，直接回车跳过）\n"
+
+_GENRE_PROMPT = "请输入选择 (1/2): "
+_GENRE_RETRY_PROMPT = "无效选择，请输入 1 或 2\n" + _GENRE_PROMPT
+_GENRE_SELECTED = "✓ 已选择题材：{}\n\n"
+_THEME_PROMPT = "主题: "
+_THEME_RETRY_PROMPT = "主题不能为空，请重新输入\n" + _THEME_PROMPT
+_THEME_ECHO = "✓ 主题：{}\n\n"
+_PREFERENCES_PROMPT = "偏好: "
+_PREFERENCES_ECHO = "✓ 偏好：{}\n\n"
+_NO_PREFERENCES = "✓ 无额外偏好\n\n"
+
+
+def _ask(prompt: str) -> str:
+    """Write prompt and read one line from stdin, like input() minus its stderr flush."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+def interactive_input() -> tuple:
+    """
+    Interactive CLI for story generation.
+
+    Returns:
+        tuple: (genre, theme_statement, additional_preferences)
+    """
+    # Banner and genre selection
+    sys.stdout.write(_BANNER)
+
+    selected = _GENRES.get(_ask(_GENRE_PROMPT).strip())
+    while selected is None:
+        selected = _GENRES.get(_ask(_GENRE_RETRY_PROMPT).strip())
+    genre, genre_name = selected
+
+    # Theme input
+    sys.stdout.write(_GENRE_SELECTED.format(genre_name) + _THEME_HEADER)
+
+    theme = _ask(_THEME_PROMPT).strip()
+    while not theme:
+        theme = _ask(_THEME_RETRY_PROMPT).strip()
+
+    # Optional preferences
+    sys.stdout.write(_THEME_ECHO.format(theme) + _PREFERENCES_HEADER)
+    preferences = _ask(_PREFERENCES_PROMPT).strip()
+
+    if preferences:
+        sys.stdout.write(_PREFERENCES_ECHO.format(preferences))
+    else:
+        sys.stdout.write(_NO_PREFERENCES)
+    sys.stdout.flush()
+
+    return genre, theme, preferences
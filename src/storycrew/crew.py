@@ -1,5 +1,6 @@
 """Base crew configuration for StoryCrew."""
 import os
+import json
 import logging
 from pathlib import Path
 import yaml
@@ -9,11 +10,16 @@ from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List, Dict, Any
 
+try:
+    from json_repair import repair_json as lib_repair_json
+except ImportError:
+    lib_repair_json = None
+
 logger = logging.getLogger("StoryCrew")
 
-# Import event listeners to register them with CrewAI event bus
-# This import statement activates all listeners in the package
-import storycrew.listeners  # noqa: F401
+# Event listeners are registered with the CrewAI event bus when the first
+# LLM is created (see get_llm and friends)
+from storycrew.listeners import install_llm_logging_listener
 
 # ==================== JSON RULES INJECTION ====================
 # This function injects universal JSON rules into the tasks config at import time
@@ -86,10 +92,11 @@ def repair_json(json_str: str) -> str:
     if not json_str:
         return json_str
 
-    try:
-        from json_repair import repair_json as lib_repair_json
-        import re
+    if lib_repair_json is None:
+        logger.warning("[JSON REPAIR] json_repair library not available, using original output")
+        return json_str
 
+    try:
         original = json_str
 
         # Step 1: Remove common trailing content that LLMs add after JSON
@@ -124,7 +131,6 @@ def repair_json(json_str: str) -> str:
                     if brace_count == 0:
                         # Try to parse up to this position
                         try:
-                            import json
                             test_parse = cleaned[:i+1]
                             json.loads(test_parse)  # Verify it's valid JSON
                             last_valid_pos = i + 1
@@ -145,9 +151,6 @@ def repair_json(json_str: str) -> str:
             logger.info("[JSON REPAIR] Applied repairs using json_repair library")
 
         return repaired
-    except ImportError:
-        logger.warning("[JSON REPAIR] json_repair library not available, using original output")
-        return json_str
     except Exception as e:
         logger.info(f"[JSON REPAIR] Repair failed with error: {str(e)[:100]}")
         return json_str
@@ -165,6 +168,9 @@ from storycrew.models import (
 load_dotenv()
 
 # Configure LLM from environment variables
+# One LLM instance per model for the whole process: every agent in every crew
+# (InitCrew, all nine chapters, Phase 3) shares it, and with it the provider's
+# HTTP client and its keep-alive connection pool
 _llm = None
 _outline_llm = None
 _llm_cache = {}  # Cache for LLM instances by env var name
@@ -173,6 +179,7 @@ def get_llm():
     """Get or create LLM instance from environment variables."""
     global _llm
     if _llm is None:
+        install_llm_logging_listener()
         # Ensure env vars are loaded
         api_key = os.getenv("OPENAI_API_KEY")
         base_url = os.getenv("OPENAI_BASE_URL")
@@ -182,8 +189,7 @@ def get_llm():
         # Format: openai/{model_name}
         llm_model = f"openai/{model_name}"
 
-        print(f"[DEBUG] Creating LLM with model: {llm_model}")
-        print(f"[DEBUG] Base URL: {base_url}")
+        logger.debug("Creating LLM with model: %s (base URL: %s)", llm_model, base_url)
 
         _llm = LLM(
             model=llm_model,
@@ -200,6 +206,7 @@ def get_outline_llm():
     """Get or create LLM instance for outline generation (long text output)."""
     global _outline_llm
     if _outline_llm is None:
+        install_llm_logging_listener()
         # Ensure env vars are loaded
         api_key = os.getenv("OPENAI_API_KEY")
         base_url = os.getenv("OPENAI_BASE_URL")
@@ -209,8 +216,7 @@ def get_outline_llm():
         # Format: openai/{model_name}
         llm_model = f"openai/{model_name}"
 
-        print(f"[DEBUG] Creating Outline LLM with model: {llm_model}")
-        print(f"[DEBUG] Base URL: {base_url}")
+        logger.debug("Creating Outline LLM with model: %s (base URL: %s)", llm_model, base_url)
 
         _outline_llm = LLM(
             model=llm_model,
@@ -228,6 +234,7 @@ def get_llm_by_env(env_var_name: str, default: str = "gpt-4o-mini"):
     global _llm_cache
 
     if env_var_name not in _llm_cache:
+        install_llm_logging_listener()
         api_key = os.getenv("OPENAI_API_KEY")
         base_url = os.getenv("OPENAI_BASE_URL")
         model_name = os.getenv(env_var_name, default)
@@ -235,8 +242,7 @@ def get_llm_by_env(env_var_name: str, default: str = "gpt-4o-mini"):
         # LiteLLM requires provider prefix for OpenAI-compatible APIs
         llm_model = f"openai/{model_name}"
 
-        print(f"[DEBUG] Creating LLM from {env_var_name}: {llm_model}")
-        print(f"[DEBUG] Base URL: {base_url}")
+        logger.debug("Creating LLM from %s: %s (base URL: %s)", env_var_name, llm_model, base_url)
 
         _llm_cache[env_var_name] = LLM(
             model=llm_model,
@@ -250,6 +256,19 @@ def get_llm_by_env(env_var_name: str, default: str = "gpt-4o-mini"):
 
     return _llm_cache[env_var_name]
 
+def get_token_usage_total() -> int:
+    """Prompt + completion tokens used so far by every LLM instance created above.
+
+    CrewAI's completion events carry only the response text, so the usage
+    tracked by each LLM (get_token_usage_summary) is the source of truth.
+    """
+    llms = [llm for llm in (_llm, _outline_llm, *_llm_cache.values()) if llm is not None]
+    total = 0
+    for llm in llms:
+        summary = llm.get_token_usage_summary()
+        total += summary.prompt_tokens + summary.completion_tokens
+    return total
+
 @CrewBase
 class Storycrew():
     """Base StoryCrew configuration - provides access to agents and tasks."""
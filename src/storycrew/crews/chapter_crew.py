@@ -1,13 +1,17 @@
 """Chapter Generation Crew for writing individual chapters."""
+import asyncio
 import logging
+import time
 from crewai import Crew, Process, Task
 from storycrew.crew import Storycrew
+from storycrew.crews.init_crew import install_json_repair_patch
 from typing import Dict, Any, Optional
 from copy import deepcopy
 from storycrew.models import (
     SceneList, JudgeReport,
     ChapterGenerationState, RetryLevel, determine_retry_level
 )
+from storycrew.tools import as_plain, is_transient_error
 
 logger = logging.getLogger("StoryCrew")
 
@@ -20,20 +24,24 @@ class ChapterCrew:
     """Crew responsible for generating a single chapter with quality gates."""
 
     def __init__(self):
+        install_json_repair_patch()
         self.base_crew = Storycrew()
         self.max_retries = 2
 
-    def _parse_scene_list_safe(self, scene_list_json: str) -> Optional[SceneList]:
-        """安全解析 SceneList JSON 字符串
+    def _parse_scene_list_safe(self, state: ChapterGenerationState) -> Optional[SceneList]:
+        """安全取出 state 中保存的 SceneList
+
+        优先复用 set_scene_list 缓存的对象；只有 scene_list 被直接改写过时，
+        才用 construct_trusted 从 JSON 重建（数据来自已校验的 plan_chapter 输出）。
 
         Args:
-            scene_list_json: SceneList 的 JSON 字符串
+            state: 当前生成状态
 
         Returns:
-            Optional[SceneList]: 解析成功返回 SceneList 对象，失败返回 None
+            Optional[SceneList]: 解析成功返回 SceneList 对象，失败或缺失返回 None
         """
         try:
-            return SceneList.model_validate_json(scene_list_json)
+            return state.get_scene_list()
         except Exception as e:
             logger.warning(f"SceneList JSON 解析失败: {e}")
             return None
@@ -115,24 +123,26 @@ class ChapterCrew:
 
         return scene_list
 
-    def _parse_and_normalize_scene_list(self, scene_list_json: str) -> Optional[SceneList]:
-        """解析并自动校正 SceneList
+    def _parse_and_normalize_scene_list(self, state: ChapterGenerationState) -> Optional[SceneList]:
+        """取出并自动校正 state 中的 SceneList
 
-        结合了解析和字数校正两个步骤。
+        结合了解析和字数校正两个步骤。校正是原地修改，所以结果会写回 state
+        （set_scene_list），保证缓存对象和 scene_list 字符串一致。
 
         Args:
-            scene_list_json: SceneList 的 JSON 字符串
+            state: 当前生成状态（scene_list 会被更新为校正后的版本）
 
         Returns:
             Optional[SceneList]: 校正后的 SceneList，解析失败返回 None
         """
         # 1. 解析
-        scene_list = self._parse_scene_list_safe(scene_list_json)
+        scene_list = self._parse_scene_list_safe(state)
         if scene_list is None:
             return None
 
         # 2. 自动校正字数分配
         normalized_list = self._normalize_scene_list_word_count(scene_list)
+        state.set_scene_list(normalized_list)
 
         return normalized_list
 
@@ -312,7 +322,7 @@ class ChapterCrew:
 
                 # Extract scene_list
                 if hasattr(outputs[0], 'pydantic'):
-                    state.scene_list = outputs[0].pydantic.model_dump_json()
+                    state.set_scene_list(outputs[0].pydantic)
 
                 # Extract draft_text
                 state.draft_text = str(outputs[1].raw) if hasattr(outputs[1], 'raw') else str(outputs[1])
@@ -383,8 +393,8 @@ class ChapterCrew:
         # ===============================
         # StoryBible access control
         # ===============================
-        story_bible_dict = story_bible.model_dump() if hasattr(story_bible, 'model_dump') else story_bible
-        story_spec_dict = story_spec.model_dump() if hasattr(story_spec, 'model_dump') else story_spec
+        story_bible_dict = as_plain(story_bible)
+        story_spec_dict = as_plain(story_spec)
 
         story_bible_public = deepcopy(story_bible_dict)
         if isinstance(story_bible_public, dict) and "truth_card" in story_bible_public:
@@ -396,7 +406,7 @@ class ChapterCrew:
         # Prepare initial inputs
         inputs = {
             "chapter_number": chapter_number,
-            "chapter_outline": chapter_outline.model_dump() if hasattr(chapter_outline, 'model_dump') else chapter_outline,
+            "chapter_outline": as_plain(chapter_outline),
             "scene_list": "",  # Placeholder for plan_chapter to generate
             "scene_list_for_write": "",  # For WRITE_ONLY retry: use saved scene_list
             "draft_text_for_edit": "",  # For EDIT_ONLY retry: use saved draft_text
@@ -418,7 +428,7 @@ class ChapterCrew:
                 elif state.last_retry_level == RetryLevel.WRITE_ONLY.value:
                     # Check if scene_list recovery is needed
                     if "scene_list" in inputs:
-                        scene_list = self._parse_and_normalize_scene_list(inputs["scene_list"])
+                        scene_list = self._parse_and_normalize_scene_list(state)
                         if scene_list is None:
                             logger.warning("SceneList recovery failed, falling back to FULL_RETRY")
                             state.last_retry_level = RetryLevel.FULL_RETRY.value
@@ -530,25 +540,28 @@ class ChapterCrew:
                 error_type = type(e).__name__
                 error_msg = str(e)
 
+                # Rate limits and timeouts are retried by the caller, which
+                # restarts the whole chapter with its own backoff (see
+                # storycrew.main); retrying them here too would multiply the
+                # two attempt budgets
+                if is_transient_error(e):
+                    logger.warning(
+                        "Chapter %s attempt %s hit %s, leaving the retry to the caller",
+                        chapter_number, attempt + 1, error_type
+                    )
+                    raise
+
                 if attempt >= self.max_retries:
                     logger.error(f"Chapter {chapter_number} failed after {attempt + 1} attempts: {error_type}: {error_msg[:100]}")
                     raise
 
-                # === Smart retry with intelligent delays ===
-                import time
-
-                if "RateLimitError" in error_type or "rate limit" in error_msg.lower():
-                    # TPM rate limit: wait 60 seconds for limit to reset
-                    delay = 60
-                    logger.warning(f"Chapter {chapter_number} hit TPM rate limit, waiting {delay}s before retry {attempt + 2}/{self.max_retries + 1}...")
-                    print(f"⏳ TPM rate limit hit, waiting {delay}s before retry...")
-                    time.sleep(delay)
-                else:
-                    # Other errors: exponential backoff delay
-                    delay = min(5 * (2 ** attempt), 30)  # 5s, 10s, 20s, 30s max
-                    logger.warning(f"Chapter {chapter_number} attempt {attempt + 1} failed with {error_type}: {error_msg[:100]}, retrying in {delay}s...")
-                    print(f"⏳ Retrying in {delay}s...")
-                    time.sleep(delay)
+                # Other errors: exponential backoff delay
+                delay = min(5 * (2 ** attempt), 30)  # 5s, 10s, 20s, 30s max
+                logger.warning(
+                    "⏳ Chapter %s attempt %s failed with %s: %s, retrying in %ss...",
+                    chapter_number, attempt + 1, error_type, error_msg[:100], delay
+                )
+                time.sleep(delay)
 
                 inputs["revision_instructions"] = ""
                 continue
@@ -562,3 +575,27 @@ class ChapterCrew:
             'attempts': self.max_retries + 1,
             'success': False
         }
+
+    async def generate_chapter_async(
+        self,
+        chapter_number: int,
+        chapter_outline: Dict[str, Any],
+        story_bible: Dict[str, Any],
+        story_spec: Dict[str, Any],
+        revision_instructions: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of generate_chapter.
+
+        Runs the blocking crew kickoffs in a worker thread (the same approach
+        as Crew.kickoff_async), so the event loop stays free to save the
+        previous chapter while this one is being generated.
+        """
+        return await asyncio.to_thread(
+            self.generate_chapter,
+            chapter_number=chapter_number,
+            chapter_outline=chapter_outline,
+            story_bible=story_bible,
+            story_spec=story_spec,
+            revision_instructions=revision_instructions
+        )
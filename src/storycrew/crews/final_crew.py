@@ -1,6 +1,9 @@
 """Final Assembly Crew for book completion."""
+import asyncio
 from crewai import Crew, Process, Task
 from storycrew.crew import Storycrew
+from storycrew.crews.init_crew import install_json_repair_patch
+from storycrew.tools import as_plain
 from typing import Dict, Any
 
 
@@ -8,6 +11,7 @@ class FinalCrew:
     """Crew responsible for final review and assembly of the complete novel."""
 
     def __init__(self):
+        install_json_repair_patch()
         self.base_crew = Storycrew()
 
     def finalize_book(
@@ -33,8 +37,8 @@ class FinalCrew:
         # Prepare inputs - convert Pydantic objects to dicts for CrewAI
         inputs = {
             "book_text": book_text,
-            "story_bible": story_bible.model_dump() if hasattr(story_bible, 'model_dump') else story_bible,
-            "story_spec": story_spec.model_dump() if hasattr(story_spec, 'model_dump') else story_spec,
+            "story_bible": as_plain(story_bible),
+            "story_spec": as_plain(story_spec),
         }
 
         # Get agents
@@ -72,3 +76,22 @@ class FinalCrew:
             'final_report': final_report,
             'success': final_report.passed
         }
+
+    async def finalize_book_async(
+        self,
+        book_text: str,
+        story_bible: Dict[str, Any],
+        story_spec: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async variant of finalize_book.
+
+        Runs the blocking kickoff in a worker thread, so the review can be
+        awaited together with the (independent) novel metadata call.
+        """
+        return await asyncio.to_thread(
+            self.finalize_book,
+            book_text=book_text,
+            story_bible=story_bible,
+            story_spec=story_spec
+        )
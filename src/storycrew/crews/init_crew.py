@@ -2,54 +2,102 @@
 from crewai import Crew, Process, Agent, Task
 from storycrew.crew import Storycrew, repair_json
 from storycrew.models import StorySpecWithResult, Concept, StoryBible
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 import logging
 import json
+import re
+
+from pydantic import ValidationError
+from pydantic_core import from_json as _partial_from_json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 logger = logging.getLogger("StoryCrew")
 
+# Precompiled pattern shared by the repair helpers
+_DIGITS_RE = re.compile(r'\d+')
+
+# StoryBible.clues buckets checked by _ensure_clue_fields
+_CLUE_BUCKETS = ('planted', 'resolved', 'open')
+
+# StoryBible fields that must be flat string arrays
+_STRING_ARRAY_FIELDS = ('used_imagery', 'used_metaphors', 'immutable_facts')
+
+# Per-helper repair details included in the single summary log line
+_MAX_LOGGED_REPAIRS = 10
+
+
+def _log_repairs(tag: str, repairs: List[str], level: int = logging.INFO) -> None:
+    """Emit one record summarizing a helper's repairs instead of one per fix."""
+    if repairs:
+        logger.log(level, "%s %d repairs: %s", tag, len(repairs), "; ".join(repairs[:_MAX_LOGGED_REPAIRS]))
+
 
-def sanitize_concept_json(json_str: str) -> str:
+def _json_loads(json_str: str) -> Any:
+    """Parse JSON with orjson when available, otherwise the stdlib parser.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+    catching the stdlib exception type.
     """
-    Fix common LLM errors in Concept generation.
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
 
-    Fixes the case where forbidden_phrases array is accidentally nested
-    inside secrets array, causing Pydantic validation errors.
 
-    Args:
-        json_str: The JSON string to sanitize
+def _json_dumps(data: Any) -> str:
+    """Serialize to a compact, non-ASCII-escaped JSON string.
+
+    orjson always emits UTF-8 without escaping, matching ensure_ascii=False.
+    Falls back to the stdlib for values orjson rejects (e.g. >64-bit ints).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _fix_concept_secrets(data: Dict[str, Any]) -> bool:
+    """
+    Flatten non-string entries in characters[].secrets in place.
 
     Returns:
-        Sanitized JSON string
+        True if any secrets list was modified
     """
-    try:
-        data = json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
-        return json_str  # If not valid JSON, return as-is
+    characters = data.get('characters')
+    if not isinstance(characters, list):
+        return False
+
+    changed = False
 
     # Fix characters.secrets - flatten nested lists that shouldn't be there
-    if 'characters' in data and isinstance(data['characters'], list):
-        for char in data['characters']:
-            if isinstance(char, dict) and 'secrets' in char:
-                secrets = char['secrets']
-                if isinstance(secrets, list):
-                    sanitized_secrets = []
-                    for item in secrets:
-                        if isinstance(item, str):
-                            sanitized_secrets.append(item)
-                        elif isinstance(item, list):
-                            # Convert nested list to comma-separated string
-                            # This fixes the LLM error where forbidden_phrases gets nested in secrets
-                            sanitized_secrets.append(", ".join(str(x) for x in item))
-                        else:
-                            # Fallback: convert to string
-                            sanitized_secrets.append(str(item))
-                    char['secrets'] = sanitized_secrets
+    for char in characters:
+        if not isinstance(char, dict):
+            continue
+        secrets = char.get('secrets')
+        if isinstance(secrets, list) and any(not isinstance(item, str) for item in secrets):
+            changed = True
+            sanitized_secrets = []
+            for item in secrets:
+                if isinstance(item, str):
+                    sanitized_secrets.append(item)
+                elif isinstance(item, list):
+                    # Convert nested list to comma-separated string
+                    # This fixes the LLM error where forbidden_phrases gets nested in secrets
+                    sanitized_secrets.append(", ".join(str(x) for x in item))
+                else:
+                    # Fallback: convert to string
+                    sanitized_secrets.append(str(item))
+            char['secrets'] = sanitized_secrets
 
-    return json.dumps(data, ensure_ascii=False)
+    return changed
 
 
-def _ensure_clue_fields(json_str: str) -> str:
+def _ensure_clue_fields(data: Dict[str, Any]) -> bool:
     """
     Ensure all Clue objects have required fields.
 
@@ -57,100 +105,114 @@ def _ensure_clue_fields(json_str: str) -> str:
     meaningful placeholders or auto-generated IDs.
 
     Args:
-        json_str: JSON string potentially containing incomplete Clue objects
+        data: Parsed StoryBible data, modified in place
 
     Returns:
-        JSON string with all Clue objects having required fields
+        True if any Clue object was modified
     """
-    try:
-        data = json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
-        return json_str  # If not valid JSON, return as-is
+    clues = data.get('clues')
+    if not isinstance(clues, dict):
+        return False
+
+    changed = False
+    repairs: List[str] = []
 
     # Fix clues.planted, clues.resolved, clues.open
-    if 'clues' in data and isinstance(data['clues'], dict):
-        for clue_list_key in ['planted', 'resolved', 'open']:
-            if clue_list_key in data['clues'] and isinstance(data['clues'][clue_list_key], list):
-                for idx, clue in enumerate(data['clues'][clue_list_key]):
-                    if isinstance(clue, dict):
-                        # Ensure clue_id field exists (auto-generate if missing)
-                        if 'clue_id' not in clue or not clue['clue_id']:
-                            chapter = clue.get('chapter_introduced', '?')
-                            clue['clue_id'] = f"clue_{clue_list_key}_{chapter}_{idx+1:03d}"
-                            logger.info(f"[CLUE REPAIR] Added missing clue_id: {clue['clue_id']}")
-
-                        # Ensure description field exists
-                        if 'description' not in clue or not clue['description']:
-                            clue_id = clue.get('clue_id', 'unknown')
-                            clue['description'] = f"[线索 {clue_id}: 详细描述待补充]"
-                            logger.info(f"[CLUE REPAIR] Added missing description for clue {clue_id}")
-
-                        # Ensure chapter_introduced is an integer
-                        if 'chapter_introduced' in clue and not isinstance(clue['chapter_introduced'], int):
-                            original_value = clue['chapter_introduced']
-                            if isinstance(original_value, str):
-                                # Try to extract number from string (e.g., "第5章" -> 5)
-                                import re
-                                match = re.search(r'\d+', str(original_value))
-                                if match:
-                                    clue['chapter_introduced'] = int(match.group())
-                                    logger.info(f"[CLUE REPAIR] Converted chapter_introduced from string to int: '{original_value}' -> {clue['chapter_introduced']}")
-                                else:
-                                    # If no number found, set to 1 as default
-                                    clue['chapter_introduced'] = 1
-                                    logger.info(f"[CLUE REPAIR] Set chapter_introduced to 1 (could not parse number from '{original_value}')")
-                            else:
-                                # Non-string, non-integer value - set to 1
-                                clue['chapter_introduced'] = 1
-                                logger.info(f"[CLUE REPAIR] Set chapter_introduced to 1 (invalid type: {type(original_value).__name__})")
+    for clue_list_key in _CLUE_BUCKETS:
+        bucket = clues.get(clue_list_key)
+        if not isinstance(bucket, list):
+            continue
+        for idx, clue in enumerate(bucket):
+            if not isinstance(clue, dict):
+                continue
 
-    return json.dumps(data, ensure_ascii=False)
+            # Ensure clue_id field exists (auto-generate if missing)
+            if not clue.get('clue_id'):
+                chapter = clue.get('chapter_introduced', '?')
+                clue['clue_id'] = f"clue_{clue_list_key}_{chapter}_{idx+1:03d}"
+                changed = True
+                repairs.append(f"Added missing clue_id: {clue['clue_id']}")
+
+            # Ensure description field exists
+            if not clue.get('description'):
+                clue_id = clue.get('clue_id', 'unknown')
+                clue['description'] = f"[线索 {clue_id}: 详细描述待补充]"
+                changed = True
+                repairs.append(f"Added missing description for clue {clue_id}")
+
+            # Ensure chapter_introduced is an integer
+            if 'chapter_introduced' in clue and not isinstance(clue['chapter_introduced'], int):
+                original_value = clue['chapter_introduced']
+                changed = True
+                if isinstance(original_value, str):
+                    # Try to extract number from string (e.g., "第5章" -> 5)
+                    match = _DIGITS_RE.search(original_value)
+                    if match:
+                        clue['chapter_introduced'] = int(match.group())
+                        repairs.append(f"Converted chapter_introduced from string to int: '{original_value}' -> {clue['chapter_introduced']}")
+                    else:
+                        # If no number found, set to 1 as default
+                        clue['chapter_introduced'] = 1
+                        repairs.append(f"Set chapter_introduced to 1 (could not parse number from '{original_value}')")
+                else:
+                    # Non-string, non-integer value - set to 1
+                    clue['chapter_introduced'] = 1
+                    repairs.append(f"Set chapter_introduced to 1 (invalid type: {type(original_value).__name__})")
+
+    _log_repairs("[CLUE REPAIR]", repairs)
+    return changed
 
 
-def _ensure_timeline_event_fields(json_str: str) -> str:
+def _ensure_timeline_event_fields(data: Dict[str, Any]) -> bool:
     """
     Ensure all TimelineEvent objects have required fields.
 
     Fixes missing 'event' field and ensures 'scene' is an integer, not a string.
 
     Args:
-        json_str: JSON string potentially containing incomplete TimelineEvent objects
+        data: Parsed StoryBible data, modified in place
 
     Returns:
-        JSON string with all TimelineEvent objects having required fields
+        True if any TimelineEvent object was modified
     """
-    try:
-        data = json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
-        return json_str  # If not valid JSON, return as-is
-
-    # Fix timeline events
-    if 'timeline' in data and isinstance(data['timeline'], list):
-        for i, event in enumerate(data['timeline']):
-            if isinstance(event, dict):
-                # Ensure event field exists
-                if 'event' not in event or not event['event']:
-                    chapter = event.get('chapter', '?')
-                    event['event'] = f"[第{chapter}章事件描述待补充]"
-                    logger.info(f"[TIMELINE REPAIR] Added missing event for timeline[{i}]")
-
-                # Ensure scene is an integer, not a string
-                if 'scene' in event and isinstance(event['scene'], str):
-                    # Try to extract number from string like "plants7" -> 7
-                    import re
-                    match = re.search(r'\d+', event['scene'])
-                    if match:
-                        event['scene'] = int(match.group())
-                        logger.info(f"[TIMELINE REPAIR] Converted scene from string to int: timeline[{i}]")
-                    else:
-                        # If no number found, set to None
-                        event['scene'] = None
-                        logger.info(f"[TIMELINE REPAIR] Set scene to None for timeline[{i}] (could not parse number)")
-
-    return json.dumps(data, ensure_ascii=False)
+    timeline = data.get('timeline')
+    if not isinstance(timeline, list):
+        return False
 
+    changed = False
+    repairs: List[str] = []
 
-def _ensure_array_field_types(json_str: str) -> str:
+    # Fix timeline events
+    for i, event in enumerate(timeline):
+        if not isinstance(event, dict):
+            continue
+
+        # Ensure event field exists
+        if not event.get('event'):
+            chapter = event.get('chapter', '?')
+            event['event'] = f"[第{chapter}章事件描述待补充]"
+            changed = True
+            repairs.append(f"Added missing event for timeline[{i}]")
+
+        # Ensure scene is an integer, not a string
+        scene = event.get('scene')
+        if isinstance(scene, str):
+            changed = True
+            # Try to extract number from string like "plants7" -> 7
+            match = _DIGITS_RE.search(scene)
+            if match:
+                event['scene'] = int(match.group())
+                repairs.append(f"Converted scene from string to int: timeline[{i}]")
+            else:
+                # If no number found, set to None
+                event['scene'] = None
+                repairs.append(f"Set scene to None for timeline[{i}] (could not parse number)")
+
+    _log_repairs("[TIMELINE REPAIR]", repairs)
+    return changed
+
+
+def _ensure_array_field_types(data: Dict[str, Any]) -> bool:
     """
     Ensure array fields that should contain only strings actually contain strings.
 
@@ -158,40 +220,42 @@ def _ensure_array_field_types(json_str: str) -> str:
     string array fields like used_metaphors, used_imagery, etc.
 
     Args:
-        json_str: JSON string potentially containing corrupted array fields
+        data: Parsed StoryBible data, modified in place
 
     Returns:
-        JSON string with all string arrays flattened to contain only strings
+        True if any string array was flattened
     """
-    try:
-        data = json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
-        return json_str  # If not valid JSON, return as-is
-
-    # Fields that must be flat string arrays
-    string_array_fields = ['used_imagery', 'used_metaphors', 'immutable_facts']
+    changed = False
+    repairs: List[str] = []
 
-    for field in string_array_fields:
-        if field in data and isinstance(data[field], list):
+    for field in _STRING_ARRAY_FIELDS:
+        items = data.get(field)
+        if isinstance(items, list):
+            if all(isinstance(item, str) for item in items):
+                continue
+            changed = True
             cleaned_array = []
-            for i, item in enumerate(data[field]):
+            for i, item in enumerate(items):
                 if isinstance(item, str):
                     # Keep strings as-is
                     cleaned_array.append(item)
-                elif isinstance(item, (list, dict)):
-                    # Convert objects/lists to string representation
-                    cleaned_array.append(str(item))
-                    logger.info(f"[ARRAY REPAIR] Converted {field}[{i}] from {type(item).__name__} to string")
                 else:
-                    # Convert other types to string
+                    # Convert objects/lists and other types to string representation
                     cleaned_array.append(str(item))
-                    logger.info(f"[ARRAY REPAIR] Converted {field}[{i}] from {type(item).__name__} to string")
+                    repairs.append(f"Converted {field}[{i}] from {type(item).__name__} to string")
             data[field] = cleaned_array
 
-    return json.dumps(data, ensure_ascii=False)
+    _log_repairs("[ARRAY REPAIR]", repairs)
+    return changed
+
+
+def _parse_int_from_str(value: str) -> Optional[int]:
+    """Extract the first integer from a string (e.g., "28岁" -> 28), or None."""
+    match = _DIGITS_RE.search(value)
+    return int(match.group()) if match else None
 
 
-def _ensure_character_fields(json_str: str) -> str:
+def _ensure_character_fields(data: Dict[str, Any]) -> bool:
     """
     Ensure all Character objects have valid field types and correct structure.
 
@@ -203,72 +267,75 @@ def _ensure_character_fields(json_str: str) -> str:
     causing validation errors like "characters.3.name Field required".
 
     Args:
-        json_str: JSON string potentially containing corrupted Character objects
+        data: Parsed StoryBible data, modified in place
 
     Returns:
-        JSON string with all Character objects having valid field types and correct structure
+        True if any Character object was fixed or removed
     """
-    import re
-    try:
-        data = json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
-        return json_str  # If not valid JSON, return as-is
+    changed = False
+    repairs: List[str] = []
 
     # Fix characters list - filter out invalid objects and fix valid ones
-    if 'characters' in data and isinstance(data['characters'], list):
+    characters = data.get('characters')
+    if isinstance(characters, list):
         clean_characters = []
-        for i, char in enumerate(data['characters']):
+        for i, char in enumerate(characters):
             if not isinstance(char, dict):
-                logger.warning(f"[CHARACTER REPAIR] Skipping non-dict object at characters[{i}]: {type(char).__name__}")
+                repairs.append(f"Skipped non-dict object at characters[{i}]: {type(char).__name__}")
                 continue
 
             # Check if this is a valid Character object (must have name and role)
-            has_name = 'name' in char and char['name']
-            has_role = 'role' in char and char['role']
+            has_name = char.get('name')
+            has_role = char.get('role')
 
             # Detect TimelineEvent objects mixed into characters array
             if not has_name and not has_role:
                 if 'chapter' in char and 'scene' in char:
                     # This is a TimelineEvent, not a Character - remove it
-                    logger.warning(f"[CHARACTER REPAIR] Found TimelineEvent in characters[{i}] (chapter={char.get('chapter')}, scene={char.get('scene')}), removing")
+                    repairs.append(f"Removed TimelineEvent in characters[{i}] (chapter={char.get('chapter')}, scene={char.get('scene')})")
                     continue
                 else:
-                    # Check if this is a completely corrupted/empty object
-                    char_str = str(char).strip()
-                    # Remove objects that are empty, only whitespace, or minimal corruption
-                    if len(char_str) <= 10 or char_str in ['{}', '{', '', ' ', '\t', '\n', '\r', '\r\n']:
+                    # Remove objects that are empty or only carry one or two
+                    # empty values; O(1) key checks instead of stringifying it
+                    if not char or (len(char) <= 2 and not any(char.values())):
                         # Completely corrupted object - remove it
-                        logger.warning(f"[CHARACTER REPAIR] Found corrupted/empty object in characters[{i}]: '{char_str[:20]}', removing")
+                        repairs.append(f"Removed corrupted/empty object in characters[{i}] (keys={list(char)})")
                         continue
                     else:
                         # Unknown object type - add default values to make it valid
-                        logger.warning(f"[CHARACTER REPAIR] Found invalid object in characters[{i}], adding default name/role")
+                        repairs.append(f"Added default name/role to invalid object in characters[{i}]")
                         char['name'] = f"Unknown Character {len(clean_characters)}"
                         char['role'] = "supporting"
+                        changed = True
 
             # Fix age field - must be integer
-            if 'age' in char and not isinstance(char['age'], (int, type(None))):
-                age_value = char['age']
-                if isinstance(age_value, str):
-                    # Try to extract number from string
-                    match = re.search(r'\d+', age_value)
-                    if match:
-                        char['age'] = int(match.group())
-                        logger.info(f"[CHARACTER REPAIR] Converted age from string to int: characters[{i}].age = {char['age']}")
-                    else:
-                        # If no number found, set to None
-                        char['age'] = None
-                        logger.info(f"[CHARACTER REPAIR] Set age to None for characters[{i}] (could not parse number from '{age_value}')")
+            age_value = char.get('age')
+            if age_value is None or isinstance(age_value, int):
+                pass
+            elif isinstance(age_value, str):
+                # Try to extract number from string (e.g., "28岁" -> 28)
+                new_age = _parse_int_from_str(age_value)
+                char['age'] = new_age
+                changed = True
+                if new_age is not None:
+                    repairs.append(f"Converted age from string to int: characters[{i}].age = {new_age}")
                 else:
-                    # Non-string, non-integer value
-                    char['age'] = None
-                    logger.info(f"[CHARACTER REPAIR] Set age to None for characters[{i}] (invalid type: {type(age_value).__name__}, value: {age_value})")
+                    repairs.append(f"Set age to None for characters[{i}] (could not parse number from '{age_value}')")
+            else:
+                # Non-string, non-integer value - set to None
+                char['age'] = None
+                changed = True
+                repairs.append(f"Set age to None for characters[{i}] (invalid type: {type(age_value).__name__}, value: {age_value})")
 
             clean_characters.append(char)
 
+        if len(clean_characters) != len(characters):
+            changed = True
         data['characters'] = clean_characters
 
-    return json.dumps(data, ensure_ascii=False)
+    # Dropped or invented characters change the cast, so this summary is a warning
+    _log_repairs("[CHARACTER REPAIR]", repairs, logging.WARNING)
+    return changed
 
 
 def _validate_story_bible_enums(story_bible: StoryBible) -> None:
@@ -305,9 +372,144 @@ def _validate_story_bible_enums(story_bible: StoryBible) -> None:
         raise ValueError(error_msg)
 
 
+class _RepairPipeline(NamedTuple):
+    """Field repairs for one output model, built once at import time."""
+
+    # (repair function, log message when it changed the data); repair
+    # functions mutate the parsed dict and return whether they changed it
+    steps: Tuple[Tuple[Callable[[Dict[str, Any]], bool], str], ...]
+    # Logged once before the steps run on the repair path
+    banner: Optional[str] = None
+    # Also run the steps before CrewAI's first parse attempt
+    pre_parse: bool = False
+
+
+# Per-model field repairs applied after JSON syntax repair, in order.
+# Supporting another output model only needs a new entry here.
+_REPAIR_PIPELINES: Dict[type, _RepairPipeline] = {
+    Concept: _RepairPipeline(
+        steps=(
+            (_fix_concept_secrets, "[CONCEPT SANITIZE] Applied Concept-specific sanitization for nested list bug"),
+        ),
+        pre_parse=True,
+    ),
+    StoryBible: _RepairPipeline(
+        steps=(
+            # Fix Clue objects (missing clue_id, description)
+            (_ensure_clue_fields, "[STORYBIBLE REPAIR] Fixed missing Clue fields"),
+            # Fix TimelineEvent objects (missing event, wrong scene type)
+            (_ensure_timeline_event_fields, "[STORYBIBLE REPAIR] Fixed TimelineEvent field issues"),
+            # Fix Character objects (corrupted age field type)
+            (_ensure_character_fields, "[STORYBIBLE REPAIR] Fixed Character field issues"),
+            # Fix array field types (used_metaphors, used_imagery containing non-strings)
+            (_ensure_array_field_types, "[STORYBIBLE REPAIR] Fixed array field type issues"),
+        ),
+        banner="[STORYBIBLE REPAIR] Applying field completion for StoryBible",
+    ),
+}
+
+
+def _run_pipeline(data: Dict[str, Any], pipeline: Optional[_RepairPipeline]) -> bool:
+    """Run a repair pipeline over data in order; return True if any step changed it."""
+    if pipeline is None:
+        return False
+    if pipeline.banner:
+        logger.info(pipeline.banner)
+    changed = False
+    for repair, message in pipeline.steps:
+        if repair(data):
+            logger.info(message)
+            changed = True
+    return changed
+
+
+def _validate_repaired(data: Dict[str, Any], model: type, is_json_output: bool) -> Any:
+    """
+    Validate repaired data directly, mirroring what handle_partial_json returns.
+
+    CrewAI's handler only accepts strings and would re-parse a dump of data;
+    model_validate on the dict skips that serialize + parse round trip.
+    """
+    validated = model.model_validate(data)
+    if is_json_output:
+        return validated.model_dump()
+    return validated
+
+
+def _salvage_partial_json(json_str: str) -> Optional[Dict[str, Any]]:
+    """
+    Recover the complete prefix of a truncated JSON document.
+
+    Long StoryBible outputs are occasionally cut off mid-object (max tokens,
+    dropped connection). pydantic-core's partial parser keeps every value that
+    was fully emitted and drops the unfinished tail, which lets the field
+    repairers fill in what is missing instead of regenerating the whole output.
+
+    Returns:
+        The recovered dict, or None if nothing could be recovered
+    """
+    try:
+        data = _partial_from_json(json_str, allow_partial=True)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or not data:
+        return None
+    return data
+
+
+# Targeted re-asks to the agent's LLM once all local repairs have failed
+MAX_JSON_CORRECTION_ROUNDS = 2
+
+
+def _describe_parse_error(error: Exception) -> str:
+    """Compact, LLM-readable description of why the output was rejected."""
+    if isinstance(error, ValidationError):
+        problems = [
+            {"loc": ".".join(str(part) for part in err["loc"]), "msg": err["msg"]}
+            for err in error.errors(include_url=False)[:20]
+        ]
+        return _json_dumps(problems)
+    return str(error)[:500]
+
+
+def _request_json_correction(agent: Any, model: type, json_str: str, error: Exception) -> Optional[str]:
+    """
+    Ask the agent's LLM to fix only the reported problems in json_str.
+
+    Far cheaper than letting CrewAI rerun the whole task: the prompt names the
+    exact fields that failed and asks for everything else to be kept as-is.
+
+    Returns:
+        The LLM's raw reply, or None if no LLM is available or the call failed
+    """
+    llm = getattr(agent, "llm", None)
+    if llm is None:
+        return None
+
+    prompt = (
+        f"你上一次输出的 {model.__name__} JSON 未通过校验，错误如下：\n"
+        f"{_describe_parse_error(error)}\n\n"
+        "只修正上述问题，其他所有字段和文本内容必须保持原样，不得改写。"
+        "只输出修正后的 JSON 对象，不要任何解释，也不要使用 markdown 代码块。\n\n"
+        f"上一次的 JSON：\n{json_str}"
+    )
+    try:
+        return llm.call([{"role": "user", "content": prompt}])
+    except Exception as exc:
+        logger.info(f"[JSON CORRECTION] LLM correction call failed: {str(exc)[:100]}")
+        return None
+
+
 # Monkey-patch CrewAI's converter to apply JSON repairs
 import crewai.utilities.converter as converter_module
-_original_handle_partial_json = converter_module.handle_partial_json
+
+# If this module is imported again (e.g. importlib.reload), keep wrapping the
+# real CrewAI function rather than our previous wrapper.
+_original_handle_partial_json = getattr(
+    converter_module.handle_partial_json,
+    "_storycrew_original",
+    converter_module.handle_partial_json,
+)
 
 def _patched_handle_partial_json(result: str, model: type, is_json_output: bool = False,
                                  agent=None, converter_cls=None):
@@ -323,12 +525,18 @@ def _patched_handle_partial_json(result: str, model: type, is_json_output: bool
     Returns:
         Validated Pydantic model instance
     """
-    # Apply model-specific sanitization before parsing
+    pipeline = _REPAIR_PIPELINES.get(model)
+
+    # Apply model-specific sanitization before parsing.
+    # Only re-serialize when a step actually changed the parsed output.
     working_result = result
-    if model == Concept:
-        working_result = sanitize_concept_json(str(result))
-        if working_result != str(result):
-            logger.info("[CONCEPT SANITIZE] Applied Concept-specific sanitization for nested list bug")
+    if pipeline is not None and pipeline.pre_parse:
+        try:
+            parsed = _json_loads(result)
+        except (json.JSONDecodeError, TypeError):
+            parsed = None
+        if isinstance(parsed, dict) and _run_pipeline(parsed, pipeline):
+            working_result = _json_dumps(parsed)
 
     try:
         # Try original parsing first
@@ -341,62 +549,107 @@ def _patched_handle_partial_json(result: str, model: type, is_json_output: bool
         # Step 1: Apply JSON syntax repairs (missing quotes, trailing commas, etc.)
         repaired = repair_json(str(working_result))
 
-        # Step 2: Apply model-specific field completion
         if repaired != str(working_result):
             logger.info(f"[JSON REPAIR] Applied syntax repairs (first 200 chars): {repaired[:200]}")
 
-        # For Concept model, apply sanitization again after repair
-        if model == Concept:
-            repaired = sanitize_concept_json(repaired)
-
-        # For StoryBible model, apply field completion for missing required fields
-        if model == StoryBible:
-            logger.info("[STORYBIBLE REPAIR] Applying field completion for StoryBible")
-
-            # Fix Clue objects (missing clue_id, description)
-            repaired_after_clues = _ensure_clue_fields(repaired)
-            if repaired_after_clues != repaired:
-                logger.info("[STORYBIBLE REPAIR] Fixed missing Clue fields")
-                repaired = repaired_after_clues
-
-            # Fix TimelineEvent objects (missing event, wrong scene type)
-            repaired_after_timeline = _ensure_timeline_event_fields(repaired)
-            if repaired_after_timeline != repaired:
-                logger.info("[STORYBIBLE REPAIR] Fixed TimelineEvent field issues")
-                repaired = repaired_after_timeline
-
-            # Fix Character objects (corrupted age field type)
-            repaired_after_characters = _ensure_character_fields(repaired)
-            if repaired_after_characters != repaired:
-                logger.info("[STORYBIBLE REPAIR] Fixed Character field issues")
-                repaired = repaired_after_characters
-
-            # Fix array field types (used_metaphors, used_imagery containing non-strings)
-            repaired_after_arrays = _ensure_array_field_types(repaired)
-            if repaired_after_arrays != repaired:
-                logger.info("[STORYBIBLE REPAIR] Fixed array field type issues")
-                repaired = repaired_after_arrays
+        # Step 2: Apply model-specific field repairs on the parsed data and
+        # validate the dict directly (no dump + re-parse inside CrewAI)
+        try:
+            data = _json_loads(repaired)
+        except (json.JSONDecodeError, TypeError):
+            data = None
 
-        # Step 3: Retry parsing with repaired JSON
         try:
+            if isinstance(data, dict):
+                _run_pipeline(data, pipeline)
+                return _validate_repaired(data, model, is_json_output)
+            # Step 3: Not a JSON object even after syntax repair - let CrewAI
+            # handle it (including its own LLM-based conversion fallback)
             return _original_handle_partial_json(repaired, model, is_json_output, agent, converter_cls)
         except Exception as e2:
-            # If still failing after all repairs, log and re-raise
             logger.info(f"[JSON REPAIR] Parse failed even after repairs. Error: {str(e2)[:100]}")
-            logger.info("[JSON REPAIR] Re-raising original error")
-            raise
 
-# Apply the monkey-patch
-converter_module.handle_partial_json = _patched_handle_partial_json
-logger.info("[JSON REPAIR] Monkey-patch applied to CrewAI converter")
+            # Step 4: Salvage a truncated output - keep the complete objects,
+            # drop the broken tail and let the field repairs fill the gaps
+            salvaged = _salvage_partial_json(str(working_result))
+            if salvaged is not None:
+                logger.info("[JSON REPAIR] Retrying with partial JSON salvaged from truncated output")
+                _run_pipeline(salvaged, pipeline)
+                try:
+                    return _validate_repaired(salvaged, model, is_json_output)
+                except Exception as e3:
+                    logger.info(f"[JSON REPAIR] Salvaged JSON still invalid. Error: {str(e3)[:100]}")
+
+            # Step 5: Re-ask the agent's LLM with the specific validation
+            # errors instead of letting CrewAI rerun the whole task
+            last_json, last_error = repaired, e2
+            for round_num in range(1, MAX_JSON_CORRECTION_ROUNDS + 1):
+                corrected = _request_json_correction(agent, model, last_json, last_error)
+                if not corrected:
+                    break
+                logger.info(f"[JSON CORRECTION] Round {round_num}/{MAX_JSON_CORRECTION_ROUNDS}: retrying with corrected output")
+                corrected = repair_json(corrected)
+                try:
+                    data = _json_loads(corrected)
+                    if not isinstance(data, dict):
+                        raise ValueError("Corrected output is not a JSON object")
+                    _run_pipeline(data, pipeline)
+                    return _validate_repaired(data, model, is_json_output)
+                except Exception as e4:
+                    logger.info(f"[JSON CORRECTION] Round {round_num} still invalid. Error: {str(e4)[:100]}")
+                    last_json, last_error = corrected, e4
+
+            # If still failing after all repairs, log and re-raise; chained to
+            # the first parse error so both show up in the traceback
+            logger.info("[JSON REPAIR] Re-raising repair error")
+            raise e2 from e
+
+_patched_handle_partial_json._storycrew_patched = True
+_patched_handle_partial_json._storycrew_original = _original_handle_partial_json
+
+
+def install_json_repair_patch() -> None:
+    """
+    Route CrewAI's structured-output parsing through the JSON repairs above.
+
+    Called by the crews' constructors instead of at import time. Idempotent:
+    a second wrapper layer would double the per-parse overhead and emit every
+    [JSON REPAIR] log line twice.
+    """
+    if getattr(converter_module.handle_partial_json, "_storycrew_patched", False):
+        return
+    converter_module.handle_partial_json = _patched_handle_partial_json
+    logger.info("[JSON REPAIR] Monkey-patch applied to CrewAI converter")
 
 
 class InitCrew:
     """Crew responsible for initializing story generation (StorySpec, StoryBible, Outline)."""
 
     def __init__(self):
+        install_json_repair_patch()
         self.base_crew = Storycrew()
 
+        # Agents, tasks and their one-task crews never change between kickoffs,
+        # so build them once; kickoff only interpolates fresh inputs
+        self.spec_crew = self._single_task_crew(
+            self.base_crew.build_story_spec(), self.base_crew.theme_interpreter())
+        self.concept_crew = self._single_task_crew(
+            self.base_crew.build_concept(), self.base_crew.concept_designer())
+        self.outline_crew = self._single_task_crew(
+            self.base_crew.build_outline(), self.base_crew.plot_architect())
+        self.bible_crew = self._single_task_crew(
+            self.base_crew.init_bible(), self.base_crew.continuity_keeper())
+
+    @staticmethod
+    def _single_task_crew(task: Task, agent: Agent) -> Crew:
+        """Bind a pre-configured task from base_crew to its agent in its own crew."""
+        task.agent = agent
+        return Crew(
+            agents=[agent],
+            tasks=[task],
+            verbose=True
+        )
+
     def kickoff(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Run the initialization phase with structured outputs.
@@ -415,98 +668,51 @@ class InitCrew:
                 - outline: Complete 9-chapter outline object
                 - story_bible: Initialized StoryBible object
         """
-        # Get agents
-        theme_interpreter = self.base_crew.theme_interpreter()
-        concept_designer = self.base_crew.concept_designer()
-        plot_architect = self.base_crew.plot_architect()
-        continuity_keeper = self.base_crew.continuity_keeper()
-
-        # Prepare inputs with placeholders
-        inputs_with_placeholders = {
-            **inputs,
+        # Single shared context for all four stages. Each stage only adds its
+        # own keys instead of copying the whole dict; placeholders are set once.
+        ctx: Dict[str, Any] = dict(inputs)
+        ctx.update({
             "StorySpec": None,
             "StyleGuide": None,
             "Concept": None,
             "StoryBible": None,
             "Outline": None,
             "PlantPayoffTable": None,
-        }
-
-        # Task 1: Build StorySpec - Use pre-configured task from base_crew
-        build_story_spec_task = self.base_crew.build_story_spec()
-        build_story_spec_task.agent = theme_interpreter
-
-        crew1 = Crew(
-            agents=[theme_interpreter],
-            tasks=[build_story_spec_task],
-            verbose=True
-        )
+        })
 
+        # Task 1: Build StorySpec
         # The monkey-patched converter will automatically repair JSON on parse errors
-        result1 = crew1.kickoff(inputs=inputs_with_placeholders)
+        result1 = self.spec_crew.kickoff(inputs=ctx)
         spec_result = result1.tasks_output[0].pydantic  # StorySpecWithResult
         novel_name = spec_result.novel_name
         story_spec = spec_result.story_spec
 
-        # Prepare inputs for next task - convert Pydantic to dict for CrewAI
-        inputs_2 = {
-            **inputs,
-            "story_spec": story_spec.model_dump(),
-            "StorySpec": story_spec.model_dump(),
-        }
+        # Add StorySpec for next task - dump once, share between both key spellings
+        spec_dump = story_spec.model_dump()
+        ctx["story_spec"] = spec_dump
+        ctx["StorySpec"] = spec_dump
 
-        # Task 2: Build Concept - Use pre-configured task from base_crew
-        build_concept_task = self.base_crew.build_concept()
-        build_concept_task.agent = concept_designer
-
-        crew2 = Crew(
-            agents=[concept_designer],
-            tasks=[build_concept_task],
-            verbose=True
-        )
-
-        result2 = crew2.kickoff(inputs=inputs_2)
+        # Task 2: Build Concept
+        result2 = self.concept_crew.kickoff(inputs=ctx)
         concept = result2.tasks_output[0].pydantic  # Direct Pydantic object
 
-        # Prepare inputs for next task - convert Pydantic to dict for CrewAI
-        inputs_3 = {
-            **inputs_2,
-            "concept": concept.model_dump(),
-            "Concept": concept.model_dump(),
-        }
-
-        # Task 3: Build Outline - Use pre-configured task from base_crew
-        build_outline_task = self.base_crew.build_outline()
-        build_outline_task.agent = plot_architect
-
-        crew3 = Crew(
-            agents=[plot_architect],
-            tasks=[build_outline_task],
-            verbose=True
-        )
+        # Add Concept for next task
+        concept_dump = concept.model_dump()
+        ctx["concept"] = concept_dump
+        ctx["Concept"] = concept_dump
 
-        result3 = crew3.kickoff(inputs=inputs_3)
+        # Task 3: Build Outline
+        result3 = self.outline_crew.kickoff(inputs=ctx)
         outline = result3.tasks_output[0].pydantic  # Direct Pydantic object
 
-        # Prepare inputs for next task - convert Pydantic to dict for CrewAI
-        inputs_4 = {
-            **inputs_3,
-            "outline": outline.model_dump(),
-            "Outline": outline.model_dump(),
-            "PlantPayoffTable": outline.plant_payoff_table,  # Already List[dict]
-        }
-
-        # Task 4: Initialize Bible - Use pre-configured task from base_crew
-        init_bible_task = self.base_crew.init_bible()
-        init_bible_task.agent = continuity_keeper
-
-        crew4 = Crew(
-            agents=[continuity_keeper],
-            tasks=[init_bible_task],
-            verbose=True
-        )
+        # Add Outline for next task
+        outline_dump = outline.model_dump()
+        ctx["outline"] = outline_dump
+        ctx["Outline"] = outline_dump
+        ctx["PlantPayoffTable"] = outline.plant_payoff_table  # Already List[dict]
 
-        result4 = crew4.kickoff(inputs=inputs_4)
+        # Task 4: Initialize Bible
+        result4 = self.bible_crew.kickoff(inputs=ctx)
         story_bible = result4.tasks_output[0].pydantic  # Direct Pydantic object
 
         # Validate enum values match Concept model
@@ -0,0 +1,8 @@
+"""StoryCrew I/O Package
+
+Background writing of generated artifacts (JSON and markdown files).
+"""
+
+from .async_writer import AsyncArtifactWriter
+
+__all__ = ["AsyncArtifactWriter"]
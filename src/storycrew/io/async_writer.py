@@ -0,0 +1,113 @@
+"""Background writer for generated artifacts.
+
+Artifact files (story_spec.json, chapters, final report, ...) are not read
+back by the LLM pipeline, so serializing and writing them doesn't need to
+block the main thread between LLM calls. AsyncArtifactWriter queues them for
+a single daemon thread; callers flush() before anything reads the files back.
+
+Recovery state that must survive a crash (story_bible_final.json) should
+still be written synchronously.
+"""
+
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, List, Tuple, Union
+
+from storycrew.tools.fast_json import dumps_compact, dumps_pretty
+
+logger = logging.getLogger("StoryCrew")
+
+# Payload kinds on the queue
+_JSON = "json"
+_COMPACT_JSON = "compact_json"
+_TEXT = "text"
+
+# Payloads are always fully encoded bytes, so skip Python's buffered file layer
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path with raw os.write calls (usually just one)."""
+    fd = os.open(path, _OPEN_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+class AsyncArtifactWriter:
+    """Write artifact files from a background thread.
+
+    Objects passed to submit_json are serialized on the writer thread, so the
+    caller must not mutate them afterwards.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._failures: List[Tuple[Path, Exception]] = []
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="storycrew-artifact-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit_json(self, path: Union[str, Path], obj: Any, pretty: bool = True) -> None:
+        """Queue obj to be written as UTF-8 JSON (indented unless pretty=False)."""
+        self._queue.put((Path(path), obj, _JSON if pretty else _COMPACT_JSON))
+
+    def submit_text(self, path: Union[str, Path], text: str) -> None:
+        """Queue text to be written as UTF-8."""
+        self._queue.put((Path(path), text, _TEXT))
+
+    def flush(self) -> List[Tuple[Path, Exception]]:
+        """Block until every queued artifact is on disk.
+
+        Returns:
+            (path, error) pairs for writes that failed since the last flush
+        """
+        self._queue.join()
+        failures, self._failures = self._failures, []
+        return failures
+
+    def close(self) -> List[Tuple[Path, Exception]]:
+        """Flush and stop the writer thread. Safe to call more than once."""
+        if self._closed:
+            return []
+        self._closed = True
+        failures = self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        return failures
+
+    def __enter__(self) -> "AsyncArtifactWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for path, error in self.close():
+            logger.error("Artifact not written: %s (%s)", path, error)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, payload, kind = item
+                try:
+                    if kind == _TEXT:
+                        data = payload.encode('utf-8')
+                    elif kind == _JSON:
+                        data = dumps_pretty(payload)
+                    else:
+                        data = dumps_compact(payload)
+                    _write_bytes(path, data)
+                except Exception as e:
+                    logger.error("Failed to write %s: %s", path, e)
+                    self._failures.append((path, e))
+            finally:
+                self._queue.task_done()
@@ -3,14 +3,15 @@
 This package contains custom event listeners that hook into CrewAI's
 event system to provide logging, monitoring, and integration capabilities.
 
-To activate listeners, simply import this package in your main application:
+To activate the LLM logging listener, install it once at startup:
 
-    import storycrew.listeners
+    from storycrew.listeners import install_llm_logging_listener
+    install_llm_logging_listener()
 
-The listener instances are created at module import time, ensuring they
-are registered with the CrewAI event bus.
+The LLM factories in storycrew.crew do this automatically; importing this
+package alone no longer registers anything with the CrewAI event bus.
 """
 
-from .llm_logging_listener import llm_logging_listener
+from .llm_logging_listener import install_llm_logging_listener
 
-__all__ = ["llm_logging_listener"]
+__all__ = ["install_llm_logging_listener"]
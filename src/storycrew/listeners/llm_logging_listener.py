@@ -6,8 +6,12 @@ This listener captures:
 - Failed LLM calls with error messages
 """
 
+import functools
+import itertools
+import json
 import logging
-from typing import Any, List
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel
 
 from crewai.events import BaseEventListener, crewai_event_bus
@@ -19,6 +23,295 @@ from crewai.events.types.llm_events import (
 
 logger = logging.getLogger("StoryCrew")
 
+# One JSON object per LLM call for log pipelines (grep/jq, batching). It does
+# not propagate into the human-readable StoryCrew log; attach a handler to
+# this logger to opt in.
+jsonl_logger = logging.getLogger("StoryCrew.llm_jsonl")
+jsonl_logger.propagate = False
+
+# Frame line around each LLM event record
+_SEPARATOR = "=" * 80
+
+# Line templates for the per-event record (str.format, one call per record part)
+_TMPL_MSG = "[LLM PROMPT] Message {0} [{1}] ({2:,} tokens est.):\n[LLM PROMPT] {3}"
+_TMPL_MSG_MULTIMODAL = "[LLM PROMPT] Message {0} [{1}]: (multimodal content)"
+_TMPL_PART_TEXT = "[LLM PROMPT]   - Text ({0:,} tokens est.): {1}"
+_TMPL_PART_IMAGE = "[LLM PROMPT]   - Image URL: {0}"
+_TMPL_USAGE = (
+    "[LLM TOKENS] 📊 Actual Token Usage:\n"
+    "[LLM TOKENS]   Input (prompt):  {prompt:,} tokens (cached: {cached:,})\n"
+    "[LLM TOKENS]   Output (completion): {completion:,} tokens (reasoning: {reasoning:,})\n"
+    "[LLM TOKENS]   Total: {total:,} tokens\n"
+    "[LLM TOKENS]   Est. Cost: ${cost:.4f}\n"
+    "[LLM TOKENS] 📈 Cumulative: {sum_in:,} in + {sum_out:,} out = {sum_total:,} total"
+)
+_TMPL_RESPONSE = "[LLM RESPONSE] 📥 Response Content ({0}, {1:,} chars):\n[LLM RESPONSE] {2}"
+
+# Multimodal messages log this many leading parts plus the last one
+_MULTIMODAL_HEAD_PARTS = 3
+
+# str.translate table deleting CJK Unified Ideographs (U+4E00..U+9FFF), so the
+# CJK count is len(text) - len(text.translate(...)) computed in C
+_CJK_DELETE_TABLE = dict.fromkeys(range(0x4E00, 0xA000))
+
+# Above this length the vectorized NumPy count beats str.translate; below it
+# the UTF-32 encode overhead dominates
+_NUMPY_MIN_CHARS = 4096
+
+
+# Optional accelerators are imported on first use only, so processes that
+# never log at INFO (tests, sub-crews) don't pay their import cost
+
+@functools.lru_cache(maxsize=1)
+def _np():
+    """Import NumPy on first use; None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@functools.lru_cache(maxsize=1)
+def _tiktoken():
+    """Import tiktoken on first use; None if it is not installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken
+
+
+@functools.lru_cache(maxsize=1)
+def _orjson():
+    """Import orjson on first use; None if it is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _count_cjk_chars(text: str) -> int:
+    """Count CJK Unified Ideographs (U+4E00..U+9FFF) in text."""
+    if len(text) > _NUMPY_MIN_CHARS:
+        np = _np()
+        if np is not None:
+            codepoints = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+            return int(np.count_nonzero((codepoints >= 0x4E00) & (codepoints <= 0x9FFF)))
+    return len(text) - len(text.translate(_CJK_DELETE_TABLE))
+
+
+def _estimate_tokens(text: str) -> int:
+    """Estimate token count using character-based heuristics.
+
+    Approximate: 1 token ≈ 4 characters for English, 2-3 characters for Chinese
+
+    Args:
+        text: Text to estimate tokens for
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+
+    # Count Chinese characters (Unicode range for CJK)
+    chinese_chars = _count_cjk_chars(text)
+    # Count English characters and others
+    other_chars = len(text) - chinese_chars
+
+    # Rough estimate: Chinese ~2 chars/token, English ~4 chars/token
+    estimated_tokens = (chinese_chars / 2) + (other_chars / 4)
+    return int(estimated_tokens)
+
+
+def _jsonl_enabled() -> bool:
+    """True if someone attached a handler to jsonl_logger at INFO or below."""
+    return bool(jsonl_logger.handlers) and jsonl_logger.isEnabledFor(logging.INFO)
+
+
+def _emit_jsonl(record: Dict[str, Any]) -> None:
+    """Serialize one record once (orjson when installed) and emit it on jsonl_logger."""
+    orjson = _orjson()
+    if orjson is not None:
+        payload = orjson.dumps(record, default=str).decode('utf-8')
+    else:
+        payload = json.dumps(record, ensure_ascii=False, default=str)
+    jsonl_logger.info("%s", payload)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Return text unchanged if it fits in limit chars, else a marked preview."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [truncated, total {len(text)} chars]"
+
+
+def _append_event_context(event: Any, lines: List[str]) -> None:
+    """Append the event's task and agent, skipping fields that are unset."""
+    task_name = getattr(event, 'task_name', None)
+    if task_name is not None:
+        lines.append(f"[LLM EVENT] Task: {task_name}")
+    agent_role = getattr(event, 'agent_role', None)
+    if agent_role is not None:
+        lines.append(f"[LLM EVENT] Agent: {agent_role}")
+
+
+def _get_field(obj: Any, name: str) -> Any:
+    """Read a field from a plain dict or by attribute (Pydantic/SDK objects)."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _response_usage(response: Any) -> Optional[Dict[str, int]]:
+    """Read token usage from an LLM response as plain ints, without dumping it.
+
+    Works on dicts as well as Pydantic/SDK usage objects (attribute access on
+    usage.prompt_tokens etc.), including the nested OpenAI details fields.
+
+    Returns:
+        Dict with prompt/completion/total/cached/reasoning counts, or None if
+        the response carries no usage
+    """
+    if isinstance(response, str):
+        return None
+    usage = _get_field(response, 'usage')
+    if usage is None:
+        return None
+
+    prompt_tokens = _get_field(usage, 'prompt_tokens') or 0
+    completion_tokens = _get_field(usage, 'completion_tokens') or 0
+    # Prompt-cache hits and reasoning tokens (_get_field on a missing details
+    # object just yields None)
+    prompt_details = _get_field(usage, 'prompt_tokens_details')
+    completion_details = _get_field(usage, 'completion_tokens_details')
+    return {
+        'prompt': prompt_tokens,
+        'completion': completion_tokens,
+        'total': _get_field(usage, 'total_tokens') or (prompt_tokens + completion_tokens),
+        'cached': _get_field(prompt_details, 'cached_tokens') or 0,
+        'reasoning': _get_field(completion_details, 'reasoning_tokens') or 0,
+    }
+
+
+def _response_text(response: Any) -> Any:
+    """Extract the text content from an LLM response without dumping it.
+
+    Handles plain strings (what CrewAI usually emits), OpenAI-style responses
+    (choices[0].message.content or choices[0].text), objects with a direct
+    content field, and falls back to str() for response types of unknown shape.
+    """
+    if isinstance(response, str):
+        return response
+
+    choices = _get_field(response, 'choices')
+    if choices:
+        # OpenAI-style response with choices
+        choice = choices[0]
+        message = _get_field(choice, 'message')
+        if message is not None:
+            return _get_field(message, 'content') or ''
+        text = _get_field(choice, 'text')
+        return text if text is not None else str(choice)
+
+    # Direct content field
+    content = _get_field(response, 'content')
+    if content is not None:
+        return content
+
+    # Fallback to raw response for anything that is not a dict or model
+    if isinstance(response, (dict, BaseModel)):
+        return None
+    return str(response)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_encoder(model: Optional[str]):
+    """Return a tiktoken encoding for the model, or None to use the heuristic.
+
+    Model names carry a LiteLLM provider prefix ("openai/gpt-4o-mini");
+    unknown (non-OpenAI) models use cl100k_base. tiktoken downloads the BPE
+    files on first use, so network and filesystem errors are expected
+    offline; they yield None, which lru_cache keeps, so the download is not
+    retried on every LLM event.
+    """
+    tiktoken = _tiktoken()
+    if tiktoken is None:
+        return None
+
+    model_name = (model or "").rsplit("/", 1)[-1]
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        pass  # Not an OpenAI model name
+    except Exception as e:
+        logger.warning("[LLM PROMPT] tiktoken unavailable, estimating tokens instead: %s", e)
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("[LLM PROMPT] tiktoken unavailable, estimating tokens instead: %s", e)
+        return None
+
+
+# Prompt messages repeat verbatim (agent system prompts, shared bible
+# context), but each can be 50KB+ and the cache keeps its key alive, so only
+# a handful are held. Responses are never repeated and skip the cache.
+_PROMPT_TOKEN_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=_PROMPT_TOKEN_CACHE_SIZE)
+def _count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Count prompt tokens with tiktoken when available, else the character heuristic."""
+    if not text:
+        return 0
+    encoder = _get_encoder(model)
+    if encoder is None:
+        return _estimate_tokens(text)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def _log_single_message(index: int, msg: Any, lines: List[str], model: Optional[str]) -> int:
+    """Append the log lines for one prompt message and return its token count."""
+    get = msg.get
+    role = get('role', 'unknown')
+    content = get('content', '')
+    append = lines.append
+
+    # Handle string content
+    if isinstance(content, str):
+        tokens = _count_tokens(content, model)
+        # Header plus the first 1000 chars for preview
+        append(_TMPL_MSG.format(index + 1, role, tokens, _truncate(content, 1000)))
+        return tokens
+
+    # Handle multimodal content (text + images)
+    tokens = 0
+    if isinstance(content, list):
+        append(_TMPL_MSG_MULTIMODAL.format(index + 1, role))
+        # Only the first few parts and the last one are logged; the rest are
+        # summarized in one line but still counted towards the token total
+        last_index = len(content) - 1
+        skipped = last_index - _MULTIMODAL_HEAD_PARTS
+        for part_index, part in enumerate(content):
+            logged = part_index < _MULTIMODAL_HEAD_PARTS or part_index == last_index
+            if part_index == last_index and skipped > 0:
+                append(f"[LLM PROMPT]   ... and {skipped} more parts ...")
+            if isinstance(part, dict):
+                if 'text' in part:
+                    text = part['text']
+                    part_tokens = _count_tokens(text, model)
+                    tokens += part_tokens
+                    if logged:
+                        append(_TMPL_PART_TEXT.format(part_tokens, _truncate(text, 500)))
+                elif logged and 'image_url' in part:
+                    # OpenAI format nests the URL: {"image_url": {"url": ...}}
+                    image_url = _get_field(part['image_url'], 'url') or part['image_url']
+                    append(_TMPL_PART_IMAGE.format(_truncate(str(image_url), 100)))
+    return tokens
+
 
 class LLMLoggingListener(BaseEventListener):
     """Logs all LLM interactions including prompts, responses, and token usage.
@@ -30,14 +323,26 @@ class LLMLoggingListener(BaseEventListener):
 
     The logged data is written to the StoryCrew logger and can be
     analyzed to optimize prompts, track costs, and debug issues.
+
+    The handlers run on CrewAI's event dispatch path. storycrew.main's
+    setup_logging() puts the StoryCrew handlers behind a single
+    QueueHandler/QueueListener, so records are only enqueued here.
     """
 
     def __init__(self):
         """Initialize the listener with counters for statistics."""
         super().__init__()
+        # LLM calls can run in parallel (async tasks); call numbers come from
+        # an atomic counter and the totals are updated under a lock. CrewAI's
+        # LLM events carry no call id, so a completed/failed record is
+        # labelled with the latest call number
+        self._call_counter = itertools.count(1)
+        self._lock = threading.Lock()
         self.call_count = 0
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cached_tokens = 0
+        self.total_reasoning_tokens = 0
 
     def setup_listeners(self, crewai_event_bus):
         """Register event handlers with the CrewAI event bus.
@@ -51,36 +356,35 @@ class LLMLoggingListener(BaseEventListener):
             """Handler for LLM call started events.
 
             Logs the outgoing prompt (messages) with estimated token count.
+            All lines of the event are emitted as one log record.
             """
-            self.call_count += 1
+            call_num = next(self._call_counter)
+            self.call_count = call_num
 
-            logger.info("=" * 80)
-            logger.info(f"[LLM EVENT] Call #{self.call_count} Started")
-            logger.info(f"[LLM EVENT] Model: {event.model}")
+            # Token estimation and previews are O(prompt length); skip them
+            # entirely when the record would be filtered anyway
+            if not logger.isEnabledFor(logging.INFO):
+                return
+
+            lines = [
+                _SEPARATOR,
+                f"[LLM EVENT] Call #{call_num} Started",
+                f"[LLM EVENT] Model: {event.model}",
+            ]
 
             # Log task and agent info if available
-            if hasattr(event, 'task_name'):
-                logger.info(f"[LLM EVENT] Task: {event.task_name}")
-            if hasattr(event, 'agent_role'):
-                logger.info(f"[LLM EVENT] Agent: {event.agent_role}")
+            _append_event_context(event, lines)
 
             # Log the prompt (messages)
             if event.messages:
-                self._log_prompt_messages(event.messages)
+                self._log_prompt_messages(event.messages, lines, getattr(event, 'model', None))
+
+            logger.info("%s", "\n".join(lines))
 
         @crewai_event_bus.on(LLMCallCompletedEvent)
         def on_llm_call_completed(source, event: LLMCallCompletedEvent):
-            """Handler for LLM call completed events.
-
-            Logs the response content and actual token usage from the API.
-            """
-            logger.info(f"[LLM EVENT] Call #{self.call_count} Completed")
-            logger.info(f"[LLM EVENT] Call Type: {event.call_type}")
-
-            # Log the response and token usage
-            self._log_response_with_tokens(event.response)
-
-            logger.info("=" * 80)
+            """Handler for LLM call completed events (see _on_call_completed)."""
+            self._on_call_completed(event)
 
         @crewai_event_bus.on(LLMCallFailedEvent)
         def on_llm_call_failed(source, event: LLMCallFailedEvent):
@@ -88,176 +392,208 @@ class LLMLoggingListener(BaseEventListener):
 
             Logs error details when an LLM call fails.
             """
-            logger.error("=" * 80)
-            logger.error(f"[LLM EVENT] Call #{self.call_count} FAILED")
-            logger.error(f"[LLM EVENT] Error: {event.error}")
+            call_num = self.call_count
+            if _jsonl_enabled():
+                _emit_jsonl({
+                    "event": "llm_call_failed",
+                    "call": call_num,
+                    "model": getattr(event, 'model', None),
+                    "task": getattr(event, 'task_name', None),
+                    "agent": getattr(event, 'agent_role', None),
+                    "error": str(event.error),
+                })
+
+            if not logger.isEnabledFor(logging.ERROR):
+                return
+
+            lines = [
+                _SEPARATOR,
+                f"[LLM EVENT] Call #{call_num} FAILED",
+                f"[LLM EVENT] Error: {event.error}",
+            ]
 
             # Log task/agent context if available
-            if hasattr(event, 'task_name'):
-                logger.error(f"[LLM EVENT] Task: {event.task_name}")
-            if hasattr(event, 'agent_role'):
-                logger.error(f"[LLM EVENT] Agent: {event.agent_role}")
+            _append_event_context(event, lines)
 
-            logger.error("=" * 80)
+            lines.append(_SEPARATOR)
+            logger.error("%s", "\n".join(lines))
 
-    def _log_prompt_messages(self, messages):
-        """Log prompt messages with token estimation.
+    def _on_call_completed(self, event: Any) -> None:
+        """Record token usage, then log the response content and usage.
+
+        The totals are accumulated before the log-level check, so they stay
+        correct when INFO is disabled. (The TPM limiter in storycrew.main does
+        not read them: CrewAI's completion events usually carry only the
+        response text, so it uses storycrew.crew.get_token_usage_total.)
+        All log lines of the event are emitted as one log record.
+        """
+        call_num = self.call_count
+        usage = _response_usage(event.response)
+        totals = self._record_usage(usage) if usage is not None else None
+
+        if _jsonl_enabled():
+            text = _response_text(event.response)
+            if not isinstance(text, str):
+                text = None
+            _emit_jsonl({
+                "event": "llm_call",
+                "call": call_num,
+                "model": getattr(event, 'model', None),
+                "call_type": event.call_type,
+                "task": getattr(event, 'task_name', None),
+                "agent": getattr(event, 'agent_role', None),
+                "usage": usage,
+                "response_chars": len(text) if text is not None else None,
+                "response_preview": _truncate(text, 200) if text is not None else None,
+            })
+
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        lines = [
+            f"[LLM EVENT] Call #{call_num} Completed",
+            f"[LLM EVENT] Call Type: {event.call_type}",
+        ]
+        _append_event_context(event, lines)
+
+        # Log the response and token usage
+        self._log_response_with_tokens(event.response, usage, totals, lines)
+
+        lines.append(_SEPARATOR)
+        logger.info("%s", "\n".join(lines))
+
+    def _record_usage(self, usage: Dict[str, int]) -> Tuple[int, int, int]:
+        """Add one call's usage to the running totals.
+
+        Returns:
+            The updated (input, output, cached) totals, read under the lock
+        """
+        with self._lock:
+            self.total_input_tokens += usage['prompt']
+            self.total_output_tokens += usage['completion']
+            self.total_cached_tokens += usage['cached']
+            self.total_reasoning_tokens += usage['reasoning']
+            return self.total_input_tokens, self.total_output_tokens, self.total_cached_tokens
+
+    def _log_prompt_messages(self, messages, lines: List[str], model: Optional[str] = None):
+        """Append prompt log lines with token counts.
 
         Args:
             messages: Either a string prompt or a list of message dicts
+            lines: Log lines of the current event, appended to in place
+            model: Model name, used to pick the tokenizer
         """
         try:
             if isinstance(messages, str):
                 # Simple string prompt
-                token_count = self._estimate_tokens(messages)
-                logger.info(f"[LLM PROMPT] 📤 Total ({token_count:,} tokens est.)")
+                token_count = _count_tokens(messages, model)
+                lines.append(f"[LLM PROMPT] 📤 Total ({token_count:,} tokens est.)")
                 # Log first 2000 chars
-                preview = messages[:2000]
-                if len(messages) > 2000:
-                    preview += f"... [truncated, total {len(messages)} chars]"
-                logger.info(f"[LLM PROMPT] {preview}")
+                lines.append(f"[LLM PROMPT] {_truncate(messages, 2000)}")
 
             elif isinstance(messages, list):
                 # List of message dicts (standard OpenAI format)
                 total_tokens = 0
-                logger.info(f"[LLM PROMPT] 📤 Messages: {len(messages)} messages")
+                lines.append(f"[LLM PROMPT] 📤 Messages: {len(messages)} messages")
 
                 for i, msg in enumerate(messages):
-                    role = msg.get('role', 'unknown')
-                    content = msg.get('content', '')
-
-                    # Handle string content
-                    if isinstance(content, str):
-                        tokens = self._estimate_tokens(content)
-                        total_tokens += tokens
-                        logger.info(f"[LLM PROMPT] Message {i+1} [{role}] ({tokens:,} tokens est.):")
-
-                        # Log first 1000 chars for preview
-                        preview = content[:1000]
-                        if len(content) > 1000:
-                            preview += f"... [truncated, total {len(content)} chars]"
-                        logger.info(f"[LLM PROMPT] {preview}")
-
-                    # Handle multimodal content (text + images)
-                    elif isinstance(content, list):
-                        logger.info(f"[LLM PROMPT] Message {i+1} [{role}]: (multimodal content)")
-                        for part in content:
-                            if isinstance(part, dict):
-                                if 'text' in part:
-                                    text = part['text']
-                                    tokens = self._estimate_tokens(text)
-                                    total_tokens += tokens
-                                    logger.info(f"[LLM PROMPT]   - Text ({tokens:,} tokens est.): {text[:500]}")
-                                elif 'image_url' in part:
-                                    logger.info(f"[LLM PROMPT]   - Image URL: {part['image_url'][:100]}")
-
-                logger.info(f"[LLM PROMPT] 📊 Total Estimated Tokens: {total_tokens:,}")
+                    total_tokens += _log_single_message(i, msg, lines, model)
+
+                lines.append(f"[LLM PROMPT] 📊 Total Estimated Tokens: {total_tokens:,}")
 
             else:
-                logger.warning(f"[LLM PROMPT] Unknown message format: {type(messages)}")
+                logger.warning("[LLM PROMPT] Unknown message format: %s", type(messages))
 
         except Exception as e:
-            logger.error(f"[LLM PROMPT] Error logging prompt: {e}")
+            logger.error("[LLM PROMPT] Error logging prompt: %s", e)
 
-    def _log_response_with_tokens(self, response):
-        """Log response content and extract token usage.
+    def _log_response_with_tokens(
+        self,
+        response,
+        usage: Optional[Dict[str, int]],
+        totals: Optional[Tuple[int, int, int]],
+        lines: List[str]
+    ):
+        """Append response content and token usage log lines.
 
         Args:
             response: Response object (could be various types)
+            usage: This call's usage from _response_usage, or None
+            totals: Running (input, output, cached) totals after this call
+            lines: Log lines of the current event, appended to in place
         """
         try:
-            response_dict = None
-
-            # Try to convert response to dict
-            if hasattr(response, 'model_dump'):
-                response_dict = response.model_dump()
-            elif hasattr(response, 'dict'):
-                response_dict = response.dict()
-            elif isinstance(response, dict):
-                response_dict = response
-            else:
-                response_dict = {'raw': str(response)}
+            # Read only the first choice's content by attribute or key;
+            # dumping the whole response model would copy every choice,
+            # message and tool call just to read one of them
+            content = _response_text(response)
 
             # Extract and log token usage
-            if isinstance(response_dict, dict) and 'usage' in response_dict:
-                usage = response_dict['usage']
-                prompt_tokens = usage.get('prompt_tokens', 0)
-                completion_tokens = usage.get('completion_tokens', 0)
-                total_tokens = usage.get('total_tokens', prompt_tokens + completion_tokens)
-
-                self.total_input_tokens += prompt_tokens
-                self.total_output_tokens += completion_tokens
-
-                logger.info(f"[LLM TOKENS] 📊 Actual Token Usage:")
-                logger.info(f"[LLM TOKENS]   Input (prompt):  {prompt_tokens:,} tokens")
-                logger.info(f"[LLM TOKENS]   Output (completion): {completion_tokens:,} tokens")
-                logger.info(f"[LLM TOKENS]   Total: {total_tokens:,} tokens")
-
-                # Calculate cost estimate
-                input_cost = (prompt_tokens / 1_000_000) * 0.50
+            completion_tokens = None
+            if usage is not None:
+                prompt_tokens = usage['prompt']
+                completion_tokens = usage['completion']
+                total_tokens = usage['total']
+                cached_tokens = usage['cached']
+                reasoning_tokens = usage['reasoning']
+                sum_in, sum_out, sum_cached = totals
+
+                # Calculate cost estimate; cached prompt tokens bill at ~1/10
+                input_cost = ((prompt_tokens - cached_tokens) * 0.50 + cached_tokens * 0.05) / 1_000_000
                 output_cost = (completion_tokens / 1_000_000) * 1.50
                 total_cost = input_cost + output_cost
-                logger.info(f"[LLM TOKENS]   Est. Cost: ${total_cost:.4f}")
-                logger.info(f"[LLM TOKENS] 📈 Cumulative: {self.total_input_tokens:,} in + {self.total_output_tokens:,} out = {self.total_input_tokens + self.total_output_tokens:,} total")
-
-            # Extract and log response content
-            content = None
-            if isinstance(response_dict, dict):
-                # OpenAI-style response with choices
-                if 'choices' in response_dict and len(response_dict['choices']) > 0:
-                    choice = response_dict['choices'][0]
-                    if 'message' in choice:
-                        content = choice['message'].get('content', '')
-                    elif 'text' in choice:
-                        content = choice['text']
-                    else:
-                        content = str(choice)
-
-                # Direct content field
-                elif 'content' in response_dict:
-                    content = response_dict['content']
-
-                # Fallback to raw response
-                elif 'raw' in response_dict:
-                    content = str(response_dict['raw'])
 
-            if content:
-                token_count = self._estimate_tokens(content)
-                logger.info(f"[LLM RESPONSE] 📥 Response Content ({token_count:,} tokens est., {len(content):,} chars):")
+                lines.append(_TMPL_USAGE.format(
+                    prompt=prompt_tokens,
+                    cached=cached_tokens,
+                    completion=completion_tokens,
+                    reasoning=reasoning_tokens,
+                    total=total_tokens,
+                    cost=total_cost,
+                    sum_in=sum_in,
+                    sum_out=sum_out,
+                    sum_total=sum_in + sum_out,
+                ))
+                if sum_in:
+                    cache_hit_rate = sum_cached / sum_in
+                    lines.append(f"[LLM TOKENS] 📈 Prompt cache hit rate: {cache_hit_rate:.1%} ({sum_cached:,} cached)")
 
-                # Log first 3000 chars
-                if len(content) > 3000:
-                    logger.info(f"[LLM RESPONSE] {content[:3000]}... [truncated, total {len(content)} chars]")
+            if content:
+                # The API already reported the exact count; only scan the
+                # response to estimate it when usage is missing
+                if completion_tokens:
+                    token_label = f"{completion_tokens:,} tokens"
                 else:
-                    logger.info(f"[LLM RESPONSE] {content}")
+                    token_label = f"{_estimate_tokens(content):,} tokens est."
+                # Header plus the first 3000 chars
+                lines.append(_TMPL_RESPONSE.format(token_label, len(content), _truncate(content, 3000)))
 
         except Exception as e:
-            logger.error(f"[LLM RESPONSE] Error logging response: {e}")
+            logger.error("[LLM RESPONSE] Error logging response: %s", e)
 
-    def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count using character-based heuristics.
 
-        Approximate: 1 token ≈ 4 characters for English, 2-3 characters for Chinese
+# The listener is created on demand rather than at import time, so importing
+# this module doesn't register handlers on the CrewAI event bus
+_listener: Optional[LLMLoggingListener] = None
+_listener_lock = threading.Lock()
 
-        Args:
-            text: Text to estimate tokens for
-
-        Returns:
-            Estimated token count
-        """
-        if not text:
-            return 0
 
-        # Count Chinese characters (Unicode range for CJK)
-        chinese_chars = sum(1 for c in text if '\u4e00' <= c <= '\u9fff')
-        # Count English characters and others
-        other_chars = len(text) - chinese_chars
+def install_llm_logging_listener() -> LLMLoggingListener:
+    """Create the process-wide listener and register it with the event bus.
 
-        # Rough estimate: Chinese ~2 chars/token, English ~4 chars/token
-        estimated_tokens = (chinese_chars / 2) + (other_chars / 4)
-        return int(estimated_tokens)
-
-
-# Create an instance of the listener at module import time
-# This ensures the listener is registered with the event bus
-llm_logging_listener = LLMLoggingListener()
+    Idempotent; called from the LLM factories in storycrew.crew, so it is in
+    place before the first LLM call.
+    """
+    global _listener
+    if _listener is None:
+        with _listener_lock:
+            if _listener is None:
+                _listener = LLMLoggingListener()
+    return _listener
+
+
+def __getattr__(name: str) -> Any:
+    # Backwards compatibility for the former module-level instance
+    if name == "llm_logging_listener":
+        return install_llm_logging_listener()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
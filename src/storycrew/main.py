@@ -6,19 +6,70 @@ A CrewAI-based system for generating 9-chapter novels with romance or mystery ge
 Features quality gates, continuity tracking, and automated chapter generation.
 """
 import sys
+import time
+import atexit
 import warnings
-import json
 import logging
+import os
+import queue
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, List, Optional, Tuple
 
-from storycrew.crews import InitCrew, ChapterCrew, FinalCrew
-from crewai import Process
+from storycrew.io import AsyncArtifactWriter
+from storycrew.tools import TPM_BUDGET_ENV, TPMWindowLimiter, as_plain, is_transient_error, summarize_chapter_lengths
+
+if TYPE_CHECKING:
+    from storycrew.crews import ChapterCrew
+    from storycrew.models import CachedModel
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+# Characters not allowed in the novel directory name (str.translate deletion table)
+_BAD_PATH_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Anything but letters, digits, '_', '-' and ' ' is dropped from the book
+# filename (\w is Unicode-aware, so CJK titles are kept intact; a translate
+# table would have to list every other code point, so this one stays a regex)
+_TITLE_UNSAFE_CHARS = re.compile(r'[^\w\- ]')
+
+# Final-book assembly: one 1 MiB write buffer, and the blank lines that
+# separate consecutive chapters
+_ASSEMBLY_BUFFER_SIZE = 1 << 20
+_CHAPTER_SEPARATOR = b"\n\n\n\n"
+
+# Whole-chapter retries for rate-limit/timeout failures: 3 tries, 30s then 60s apart.
+# This is the only retry budget for those errors (generate_chapter re-raises
+# them at once), so a chapter is tried at most 3 times
+_CHAPTER_ATTEMPTS = 3
+_CHAPTER_BACKOFF_SECONDS = 30.0
+
+# Pause between chapters when no MODEL_TPM_BUDGET is configured
+_DEFAULT_CHAPTER_PAUSE_SECONDS = 30.0
+
+# Console banner printed when a run finishes (plain ASCII, written as bytes)
+_COMPLETION_BANNER = b"=" * 80 + b"\nStoryCrew Novel Generation Completed\n" + b"=" * 80 + b"\n"
+
+
+# Background thread writing the run's log handlers (see setup_logging)
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush the queued log records, then stop and close the run's handlers."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
 
 def setup_logging() -> logging.Logger:
     """
@@ -27,6 +78,10 @@ def setup_logging() -> logging.Logger:
     Creates a logs directory if it doesn't exist and sets up a new log file
     with timestamp for each run.
 
+    The file and console handlers run on a QueueListener thread; the logger
+    itself only has a QueueHandler, so logging calls made during chapter
+    generation just enqueue the record instead of blocking on I/O.
+
     Returns:
         Configured logger instance
     """
@@ -42,7 +97,8 @@ def setup_logging() -> logging.Logger:
     logger = logging.getLogger("StoryCrew")
     logger.setLevel(logging.INFO)
 
-    # Clear any existing handlers
+    # Clear any existing handlers (flushing the previous run's writer thread)
+    _stop_log_listener()
     logger.handlers.clear()
 
     # Create file handler
@@ -61,286 +117,294 @@ def setup_logging() -> logging.Logger:
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand the real handlers to a background listener; the logger only enqueues
+    global _log_listener
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _log_listener.start()
+    logger.addHandler(QueueHandler(log_queue))
 
     # Log initialization
     logger.info("=" * 80)
     logger.info("StoryCrew Logging Initialized")
-    logger.info(f"Log file: {log_file}")
+    logger.info("Log file: %s", log_file)
     logger.info("=" * 80)
 
     return logger
 
 
-def run(
-    genre: str = "romance",
-    theme_statement: str = "一个关于职场爱情的故事",
-    additional_preferences: str = "",
-    output_dir: Optional[str] = None
-) -> Dict[str, Any]:
-    """
-    Run the complete story generation pipeline.
+def _log_write_failures(failures: List[Tuple[Path, Exception]], logger: logging.Logger) -> None:
+    """Report artifacts the background writer could not save."""
+    for path, error in failures:
+        logger.error("Could not save %s: %s", path, error)
 
-    Args:
-        genre: "romance" or "mystery"
-        theme_statement: Core theme of the story
-        additional_preferences: Optional user preferences
-        output_dir: Directory to save output files (default: ./output)
 
-    Returns:
-        Dictionary containing generation results and metadata
-    """
-    # Setup logging
-    logger = setup_logging()
+def _text_length(text: Any) -> int:
+    """Length of a chapter text for the statistics; 0 if it is blank or not a string."""
+    if isinstance(text, str) and text.strip():
+        return len(text)
+    return 0
 
-    logger.info("Starting StoryCrew Novel Generation")
-    logger.info(f"Genre: {genre}")
-    logger.info(f"Theme: {theme_statement}")
-    logger.info(f"Additional Preferences: {additional_preferences if additional_preferences else 'None'}")
 
-    print("=" * 80)
-    print("StoryCrew: Novel Generation System")
-    print("=" * 80)
-    print(f"Genre: {genre}")
-    print(f"Theme: {theme_statement}")
-    print()
+def _chapter_title(chapter_text: Any) -> str:
+    """First line of a chapter text ("第X章：标题"), or "" if there is none."""
+    if not isinstance(chapter_text, str):
+        return ""
+    return chapter_text.partition('\n')[0].strip()
 
-    # Setup base output directory
-    if output_dir is None:
-        base_output_dir = Path("./novels")
-    else:
-        base_output_dir = Path(output_dir)
-    base_output_dir.mkdir(parents=True, exist_ok=True)
 
-    logger.info(f"Output directory: {base_output_dir.absolute()}")
-
-    # Track generation metadata
-    generation_metadata = {
-        "genre": genre,
-        "theme_statement": theme_statement,
-        "additional_preferences": additional_preferences,
-        "start_time": datetime.now().isoformat(),
-        "chapters_generated": [],
-        "total_chapters": 9,
-        "novel_name": None,  # Will be set after initialization
-        "novel_dir": None
-    }
-
-    # ==================== PHASE 1: INITIALIZATION ====================
-    logger.info("=" * 80)
-    logger.info("[Phase 1] Initialization - Creating novel name, StorySpec, StoryBible, and Outline")
-    logger.info("=" * 80)
-
-    print("[Phase 1] Initialization - Creating novel name, StorySpec, StoryBible, and Outline")
-    print("-" * 80)
-
-    init_crew = InitCrew()
-    init_inputs = {
-        "genre": genre,
-        "theme_statement": theme_statement,
-        "additional_preferences": additional_preferences
-    }
-
-    try:
-        logger.info("Starting InitCrew kickoff...")
-        init_result = init_crew.kickoff(inputs=init_inputs)
-        logger.info("InitCrew completed successfully")
-        print("✓ Initialization complete")
-        print()
-
-        # Parse novel_name and story_spec from init_result
-        # The result is a dict with Pydantic objects
-        try:
-            # Convert Pydantic objects to dicts for JSON serialization
-            def pydantic_to_dict(obj):
-                """Convert Pydantic objects to dictionaries."""
-                if hasattr(obj, 'model_dump'):
-                    return obj.model_dump()
-                elif hasattr(obj, 'dict'):
-                    return obj.dict()
-                elif isinstance(obj, dict):
-                    return {k: pydantic_to_dict(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [pydantic_to_dict(item) for item in obj]
-                else:
-                    return obj
-
-            # Convert result dict to JSON-serializable format
-            result_dict = {k: pydantic_to_dict(v) for k, v in init_result.items()}
-
-            # Extract novel_name (it's already at top level now)
-            novel_name = result_dict.get('novel_name', '未命名小说')
-            story_spec = result_dict.get('story_spec', {})
-            story_bible = result_dict.get('story_bible', {})
-            outline = result_dict.get('outline', {})
-
-            # Sanitize novel name for directory (remove special characters)
-            novel_name_sanitized = re.sub(r'[<>:"/\\|?*]', '', novel_name)
-            novel_name_sanitized = novel_name_sanitized.strip()
-
-            logger.info(f"Novel Name extracted: {novel_name}")
-            logger.info(f"Sanitized directory name: {novel_name_sanitized}")
-
-            print(f"✓ Novel Name: {novel_name}")
-            print()
-
-            # Create novel-specific directory
-            novel_dir = base_output_dir / novel_name_sanitized
-            novel_dir.mkdir(parents=True, exist_ok=True)
-
-            logger.info(f"Created novel directory: {novel_dir.absolute()}")
-            print(f"✓ Created novel directory: {novel_dir}")
-            print()
+def _iter_novel(metadata: Any, chapter_files: List[Path]) -> Iterator[bytes]:
+    """
+    Yield the final book as UTF-8 chunks.
 
-            # Update metadata
-            generation_metadata['novel_name'] = novel_name
-            generation_metadata['novel_dir'] = str(novel_dir.absolute())
+    Layout: title, introduction, TOC, then the chapters (copied from disk
+    as-is, separated by blank lines) and the end marker.
+    """
+    header_parts = [
+        f"# {metadata.title}\n",
+        f"## 简介\n{metadata.introduction}\n",
+        "## 目录\n",
+        *metadata.table_of_contents,
+        "",  # Empty line after TOC
+        "## 正文\n",
+        "",
+    ]
+    yield "\n".join(header_parts).encode("utf-8")
+
+    for i, chapter_file in enumerate(chapter_files):
+        if i:
+            yield _CHAPTER_SEPARATOR
+        yield chapter_file.read_bytes()
+    if chapter_files:
+        yield b"\n"
+
+    yield "\n[全书完]".encode("utf-8")
+
+
+def _prepare_assembly(
+    novel_dir: Path,
+    chapter_paths: List[Path],
+    chapter_lengths: Dict[int, int],
+    logger: logging.Logger
+) -> Tuple[List[Path], Dict[str, Any]]:
+    """
+    Phase 3 work that doesn't depend on the novel metadata.
 
-        except (json.JSONDecodeError, TypeError) as e:
-            print(f"⚠ Warning: Could not parse novel_name from result: {e}")
-            print("Using default naming...")
-            novel_name = f"{genre}_novel_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            novel_dir = base_output_dir / novel_name
-            novel_dir.mkdir(parents=True, exist_ok=True)
+    Returns:
+        Tuple of (chapter files present on disk, in order; chapter statistics)
+    """
+    # One directory scan instead of a stat() per chapter file
+    with os.scandir(novel_dir) as entries:
+        existing_files = {entry.name for entry in entries if entry.is_file()}
+
+    chapter_files = []
+    for i, chapter_file in enumerate(chapter_paths, 1):
+        if chapter_file.name in existing_files:
+            chapter_files.append(chapter_file)
+        else:
+            logger.error("  Chapter %s not found!", i)
 
-            story_spec = init_inputs
-            story_bible = init_inputs
-            outline = init_inputs
+    return chapter_files, summarize_chapter_lengths(chapter_lengths, total_chapters=9)
 
-            generation_metadata['novel_name'] = novel_name
-            generation_metadata['novel_dir'] = str(novel_dir.absolute())
 
-        # Save initialization outputs to novel directory
-        with open(novel_dir / "story_spec.json", "w", encoding="utf-8") as f:
-            json.dump(story_spec, f, ensure_ascii=False, indent=2)
-        print(f"✓ Saved StorySpec to {novel_dir / 'story_spec.json'}")
+class _RunResult(dict):
+    """Result dict of run() that still answers the deprecated 'final_book' key.
 
-        with open(novel_dir / "story_bible.json", "w", encoding="utf-8") as f:
-            json.dump(story_bible, f, ensure_ascii=False, indent=2)
-        print(f"✓ Saved StoryBible to {novel_dir / 'story_bible.json'}")
+    The book text is no longer kept in memory; run() returns its path as
+    'final_book_file'. result['final_book'] and result.get('final_book')
+    read that file on each access (with a DeprecationWarning). It is not a
+    stored key, so `in` and iteration do not see it.
+    """
 
-        with open(novel_dir / "outline.json", "w", encoding="utf-8") as f:
-            json.dump(outline, f, ensure_ascii=False, indent=2)
-        print(f"✓ Saved Outline to {novel_dir / 'outline.json'}")
-        print()
+    def __missing__(self, key):
+        if key == 'final_book' and 'final_book_file' in self:
+            return self._read_final_book()
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == 'final_book' and key not in self and 'final_book_file' in self:
+            return self._read_final_book()
+        return super().get(key, default)
+
+    def _read_final_book(self) -> str:
+        # stacklevel 3: the caller of result[...] / result.get(...)
+        warnings.warn(
+            "run()['final_book'] is deprecated; read the file at run()['final_book_file'] instead",
+            DeprecationWarning,
+            stacklevel=3
+        )
+        return Path(self['final_book_file']).read_text(encoding='utf-8')
+
+
+def _generate_chapters(
+    chapter_crew: "ChapterCrew",
+    outline: Any,
+    current_bible: "CachedModel",
+    story_spec: Any,
+    chapter_paths: List[Path],
+    review_paths: List[Path],
+    writer: AsyncArtifactWriter,
+    tokens_used: Callable[[], int],
+    generation_metadata: Dict[str, Any],
+    logger: logging.Logger
+) -> Tuple[Dict[int, int], Dict[int, str], "CachedModel"]:
+    """
+    Phase 2: generate the 9 chapters in order.
+
+    Chapters are deliberately not generated concurrently: plan_chapter and
+    write_chapter read the StoryBible that update_bible produced for the
+    previous chapter, and StoryBible updates are full replacements, so
+    chapters started from the same bible can't be merged back without losing
+    one chapter's continuity changes. The loop is plain synchronous code, so
+    run() also works when called from inside a running event loop; saving a
+    chapter only queues it on the background writer, which writes it while
+    the next chapter is being generated.
+
+    Instead of a fixed pause between chapters, the token usage of each chapter
+    is recorded in a 60s sliding window against MODEL_TPM_BUDGET; the next
+    chapter only waits if it would push the window past 90% of the budget
+    (its cost is estimated from the previous chapter). tokens_used returns the
+    run's total token usage so far. Without a budget, chapters are spaced by
+    a fixed _DEFAULT_CHAPTER_PAUSE_SECONDS pause instead.
+
+    current_bible is updated in place after every chapter; as a CachedModel it
+    is dumped once per chapter (when it changes) rather than on every read.
+
+    Chapter texts are not kept in memory once they are queued for writing;
+    only their lengths (for the Phase 3 statistics) and the titles of the
+    chapters that passed (for the metadata call) are recorded.
 
-    except Exception as e:
-        logger.error(f"Initialization failed: {e}", exc_info=True)
-        print(f"✗ Initialization failed: {e}")
-        raise
+    Returns:
+        Tuple of ({chapter number: text length, 0 if blank},
+        {chapter number: title line, passed chapters only}, final StoryBible)
+    """
+    limiter = TPMWindowLimiter.from_env()
+    chapter_lengths: Dict[int, int] = {}
+    chapter_titles: Dict[int, str] = {}
+    last_chapter_tokens = 0
 
-    # ==================== PHASE 2: CHAPTER GENERATION LOOP ====================
-    logger.info("=" * 80)
-    logger.info("[Phase 2] Chapter Generation - Writing 9 chapters with quality gates")
-    logger.info("=" * 80)
+    # Per-chapter outlines, extracted from BookOutline once up front
+    outline_chapters = (outline.get('chapters') or []) if isinstance(outline, dict) else []
 
-    print("[Phase 2] Chapter Generation - Writing 9 chapters with quality gates")
-    print("-" * 80)
+    for chapter_num in range(1, 10):
+        if limiter is not None:
+            waited = limiter.acquire(last_chapter_tokens)
+            if waited:
+                logger.info("Waited %.1fs for the TPM budget before chapter %s", waited, chapter_num)
+        elif chapter_num > 1:
+            logger.info(
+                "Waiting %.0fs before chapter %s to avoid TPM rate limiting (set %s to pace by usage)",
+                _DEFAULT_CHAPTER_PAUSE_SECONDS, chapter_num, TPM_BUDGET_ENV
+            )
+            time.sleep(_DEFAULT_CHAPTER_PAUSE_SECONDS)
 
-    chapter_crew = ChapterCrew()
-    chapters = []
-    current_bible = story_bible
+        logger.info("[Chapter %s/9] Starting generation...", chapter_num)
 
-    for chapter_num in range(1, 10):
-        logger.info(f"[Chapter {chapter_num}/9] Starting generation...")
-        print(f"[Chapter {chapter_num}/9] Starting generation...")
-
-        # Extract chapter outline from BookOutline
-        if isinstance(outline, dict) and 'chapters' in outline:
-            outline_list = outline.get('chapters', [])
-            if outline_list and len(outline_list) >= chapter_num:
-                chapter_outline = outline_list[chapter_num - 1]
-            else:
-                chapter_outline = {}
+        # Chapter outline from BookOutline ({} if the outline is short)
+        if chapter_num <= len(outline_chapters):
+            chapter_outline = outline_chapters[chapter_num - 1]
         else:
             chapter_outline = {}
 
-        try:
-            result = chapter_crew.generate_chapter(
-                chapter_number=chapter_num,
-                chapter_outline=chapter_outline,
-                story_bible=current_bible,
-                story_spec=story_spec
+        # generate_chapter retries judge failures and other errors itself but
+        # re-raises rate-limit/timeout errors; those get the whole chapter
+        # another go here, instead of dropping it outright
+        result = None
+        for attempt in range(1, _CHAPTER_ATTEMPTS + 1):
+            tokens_before = tokens_used()
+            error = None
+            try:
+                result = chapter_crew.generate_chapter(
+                    chapter_number=chapter_num,
+                    chapter_outline=chapter_outline,
+                    story_bible=current_bible.to_dict(),
+                    story_spec=story_spec
+                )
+            except Exception as e:
+                error = e
+            finally:
+                last_chapter_tokens = tokens_used() - tokens_before
+                if limiter is not None:
+                    limiter.record(last_chapter_tokens)
+
+            if error is None:
+                break
+            if attempt == _CHAPTER_ATTEMPTS or not is_transient_error(error):
+                logger.error("Chapter %s failed, continuing with next chapter: %s", chapter_num, error, exc_info=error)
+                break
+            delay = _CHAPTER_BACKOFF_SECONDS * 2 ** (attempt - 1)
+            logger.warning(
+                "Chapter %s hit a transient error (%s), retrying in %.0fs (attempt %s/%s)",
+                chapter_num, type(error).__name__, delay, attempt + 1, _CHAPTER_ATTEMPTS
             )
+            time.sleep(delay)
+
+        if result is None:
+            continue
 
+        # The next chapter builds on this chapter's bible, pass or fail
+        updated_bible = result.get('updated_bible')
+        if updated_bible is not None:
+            current_bible.update(updated_bible)
+
+        try:
             chapter_text = result.get('chapter_text', '')
-            updated_bible = result.get('updated_bible', current_bible)
             judge_report = result.get('judge_report', {})
             attempts = result.get('attempts', 1)
 
             # Convert Pydantic objects to dicts if needed
-            if hasattr(updated_bible, 'model_dump'):
-                updated_bible = updated_bible.model_dump()
-            if hasattr(judge_report, 'model_dump'):
-                judge_report = judge_report.model_dump()
+            judge_report = as_plain(judge_report)
 
             # Validate chapter_text before saving
             if not chapter_text or (isinstance(chapter_text, str) and chapter_text.strip() == ''):
-                logger.warning(f"Chapter {chapter_num} text is empty or invalid!")
-                logger.warning(f"Attempt: {attempts}")
-                logger.warning(f"Result keys: {list(result.keys())}")
-                logger.warning(f"chapter_text type: {type(chapter_text)}")
-                print(f"⚠ Warning: Chapter {chapter_num} text is empty or invalid!")
-                print(f"  Attempt: {attempts}")
-                print(f"  Result keys: {list(result.keys())}")
-                print(f"  chapter_text type: {type(chapter_text)}")
+                logger.warning("Chapter %s text is empty or invalid!", chapter_num)
+                logger.warning("Attempt: %s", attempts)
+                logger.warning("Result keys: %s", list(result.keys()))
+                logger.warning("chapter_text type: %s", type(chapter_text))
                 # Try to extract from raw result if available
                 if 'raw_result' in result:
                     logger.info("Attempting to extract from raw_result...")
-                    print(f"  Attempting to extract from raw_result...")
                     chapter_text = str(result.get('raw_result', ''))
                 # New: if chapter_text is a dict, try to extract raw_output field
                 elif isinstance(chapter_text, dict) and 'raw_output' in chapter_text:
                     logger.info("Extracting from raw_output field in dictionary...")
-                    print(f"  Extracting from raw_output field in dictionary...")
                     chapter_text = chapter_text.get('raw_output', '')
                 # Continue anyway - file will be empty but won't crash
             else:
                 # New: check if chapter_text is a dictionary
                 if isinstance(chapter_text, dict):
                     if 'raw_output' in chapter_text:
-                        logger.warning(f"Chapter {chapter_num} text is a dictionary, extracting raw_output...")
-                        print(f"  ⚠ Warning: chapter_text is a dict, extracting raw_output...")
+                        logger.warning("Chapter %s text is a dictionary, extracting raw_output...", chapter_num)
                         chapter_text = chapter_text.get('raw_output', '')
                     else:
-                        logger.warning(f"Chapter {chapter_num} text is an unexpected dictionary!")
-                        print(f"  ⚠ Warning: chapter_text is an unexpected dict: {list(chapter_text.keys())}")
+                        logger.warning("Chapter %s text is an unexpected dictionary!", chapter_num)
                         chapter_text = str(chapter_text)
 
                 # Log chapter text length for verification
                 text_length = len(chapter_text) if isinstance(chapter_text, str) else 0
-                logger.info(f"Chapter {chapter_num} text length: {text_length} characters")
-                print(f"  Chapter text length: {text_length} characters")
+                logger.info("Chapter %s text length: %s characters", chapter_num, text_length)
 
             # Check if chapter passed quality gate
             if judge_report.get('passed', False):
-                logger.info(f"Chapter {chapter_num} completed successfully (attempts: {attempts})")
-                print(f"✓ Chapter {chapter_num} complete (attempts: {attempts})")
-                chapters.append(chapter_text)
-                current_bible = updated_bible
+                logger.info("Chapter %s completed successfully (attempts: %s)", chapter_num, attempts)
+                chapter_lengths[chapter_num] = _text_length(chapter_text)
+                chapter_titles[chapter_num] = _chapter_title(chapter_text)
 
                 # Save chapter
-                chapter_file = novel_dir / f"chapter_{chapter_num:02d}.md"
-                with open(chapter_file, "w", encoding="utf-8") as f:
-                    f.write(chapter_text)
-                logger.info(f"Saved chapter {chapter_num} to {chapter_file}")
-                print(f"✓ Saved chapter {chapter_num} to {chapter_file}")
+                chapter_file = chapter_paths[chapter_num - 1]
+                writer.submit_text(chapter_file, chapter_text)
+                logger.info("Saved chapter %s to %s", chapter_num, chapter_file)
             else:
-                logger.warning(f"Chapter {chapter_num} did not pass quality gate after {attempts} attempts")
-                logger.warning(f"Issues: {[issue.get('note') for issue in judge_report.get('issues', [])]}")
-                print(f"⚠ Chapter {chapter_num} did not pass quality gate after {attempts} attempts")
-                print(f"  Issues: {[issue.get('note') for issue in judge_report.get('issues', [])]}")
+                # Collected once for both the log record and the console
+                issue_notes = [issue.get('note') for issue in judge_report.get('issues', [])]
+                logger.warning("Chapter %s did not pass quality gate after %s attempts", chapter_num, attempts)
+                logger.warning("Issues: %s", issue_notes)
                 # Still save and continue (can be manually fixed later)
-                chapters.append(chapter_text)
-                current_bible = updated_bible
+                chapter_lengths[chapter_num] = _text_length(chapter_text)
 
-                chapter_file = novel_dir / f"chapter_{chapter_num:02d}_needs_review.md"
-                with open(chapter_file, "w", encoding="utf-8") as f:
-                    f.write(chapter_text)
-                logger.info(f"Saved chapter {chapter_num} (needs review) to {chapter_file}")
-                print(f"✓ Saved chapter {chapter_num} (needs review) to {chapter_file}")
+                chapter_file = review_paths[chapter_num - 1]
+                writer.submit_text(chapter_file, chapter_text)
+                logger.info("Saved chapter %s (needs review) to %s", chapter_num, chapter_file)
 
             # Track metadata
             generation_metadata['chapters_generated'].append({
@@ -351,511 +415,482 @@ def run(
             })
 
         except Exception as e:
-            logger.error(f"Chapter {chapter_num} failed: {e}", exc_info=True)
-            print(f"✗ Chapter {chapter_num} failed: {e}")
-            print("  Continuing with next chapter...")
+            logger.error("Chapter %s failed, continuing with next chapter: %s", chapter_num, e, exc_info=True)
             continue
 
-        print()
-
-        # === Inter-chapter delay to avoid TPM rate limit accumulation ===
-        if chapter_num < 9:  # No need to delay after the last chapter
-            delay_seconds = 30
-            logger.info(f"Waiting {delay_seconds}s before next chapter to avoid TPM rate limiting...")
-            print(f"⏳ Waiting {delay_seconds}s before next chapter (avoiding rate limiting)...")
-            import time
-            time.sleep(delay_seconds)
-
-    # Save updated StoryBible
-    logger.info("Saving final StoryBible...")
-    with open(novel_dir / "story_bible_final.json", "w", encoding="utf-8") as f:
-        json.dump(current_bible, f, ensure_ascii=False, indent=2)
-    logger.info(f"Saved final StoryBible to {novel_dir / 'story_bible_final.json'}")
-    print(f"✓ Saved final StoryBible to {novel_dir / 'story_bible_final.json'}")
-    print()
-
-    # ==================== PHASE 3: FINAL ASSEMBLY ====================
-    logger.info("=" * 80)
-    logger.info("[Phase 3] Final Assembly - Generate metadata and assemble novel")
-    logger.info("=" * 80)
+    return chapter_lengths, chapter_titles, current_bible
 
-    print("[Phase 3] Final Assembly - Generate metadata and assemble novel")
-    print("-" * 80)
 
-    # Step 1: Generate metadata using LLM (title, introduction, TOC)
-    logger.info("Step 1: Generating novel metadata (title, introduction, TOC)...")
-    print("Step 1: Generating novel metadata...")
+def run(
+    genre: str = "romance",
+    theme_statement: str = "一个关于职场爱情的故事",
+    additional_preferences: str = "",
+    output_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run the complete story generation pipeline.
 
-    try:
-        from storycrew.crew import Storycrew
-        base_crew = Storycrew()
-
-        # Extract chapter titles for metadata generation
-        chapter_titles = []
-        for i in range(1, 10):
-            chapter_file = novel_dir / f"chapter_{i:02d}.md"
-            if chapter_file.exists():
-                with open(chapter_file, 'r', encoding='utf-8') as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        chapter_titles.append(first_line)
-                    else:
-                        chapter_titles.append(f"第{i}章")
-            else:
-                chapter_titles.append(f"第{i}章")
+    Args:
+        genre: "romance" or "mystery"
+        theme_statement: Core theme of the story
+        additional_preferences: Optional user preferences
+        output_dir: Directory to save output files (default: ./output)
 
-        # Create metadata generation task
-        metadata_task = base_crew.generate_novel_metadata()
-        metadata_task.agent = base_crew.line_editor()
+    Returns:
+        Dictionary containing generation results and metadata
+    """
+    # CrewAI and the crews are imported here rather than at module level, so
+    # `storycrew --help` and argument errors don't pay for loading them
+    from crewai import Crew, Process
+    from storycrew.crew import Storycrew, get_llm, get_token_usage_total
+    from storycrew.crews import InitCrew, ChapterCrew
+    from pydantic import BaseModel
+    from storycrew.models import CachedModel, NovelMetadata
 
-        # Prepare inputs
-        metadata_inputs = {
-            "story_spec": story_spec.model_dump() if hasattr(story_spec, 'model_dump') else story_spec,
-            "story_bible": current_bible.model_dump() if hasattr(current_bible, 'model_dump') else current_bible,
-            "chapter_titles": chapter_titles
-        }
+    # Setup logging
+    logger = setup_logging()
 
-        # Execute metadata generation
-        from crewai import Crew
-        metadata_crew = Crew(
-            agents=[base_crew.line_editor()],
-            tasks=[metadata_task],
-            process=Process.sequential,
-            verbose=True
-        )
+    logger.info("Starting StoryCrew Novel Generation")
+    logger.info("Genre: %s", genre)
+    logger.info("Theme: %s", theme_statement)
+    logger.info("Additional Preferences: %s", additional_preferences if additional_preferences else 'None')
 
-        metadata_result = metadata_crew.kickoff(inputs=metadata_inputs)
-        metadata = metadata_result.pydantic  # NovelMetadata object
-
-        logger.info(f"Generated metadata:")
-        logger.info(f"  Title: {metadata.title}")
-        logger.info(f"  Introduction: {metadata.introduction[:100]}...")
-        logger.info(f"  TOC: {len(metadata.table_of_contents)} chapters")
-        print(f"  ✓ Title: {metadata.title}")
-        print(f"  ✓ Introduction: {metadata.introduction[:100]}...")
-        print(f"  ✓ TOC: {len(metadata.table_of_contents)} chapters")
-        print()
-
-    except Exception as e:
-        logger.warning(f"Metadata generation failed: {e}, using fallback")
-        print(f"⚠ Metadata generation failed: {e}, using fallback")
-        # Fallback metadata
-        metadata = type('Metadata', (), {
-            'title': novel_name,
-            'introduction': f"《{novel_name}》是一部九章节的小说。",
-            'table_of_contents': chapter_titles
-        })()
-        print()
-
-    # Step 2: Assemble complete novel using Python (deterministic, fast, complete)
-    logger.info("Step 2: Assembling complete novel...")
-    print("Step 2: Assembling complete novel...")
-
-    # Read all chapters
-    chapter_contents = []
-    for i in range(1, 10):
-        chapter_file = novel_dir / f"chapter_{i:02d}.md"
-        if chapter_file.exists():
-            with open(chapter_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                chapter_contents.append(content)
-                logger.info(f"  Read chapter {i}: {len(content)} characters")
-        else:
-            logger.error(f"  Chapter {i} not found!")
-
-    logger.info(f"Read {len(chapter_contents)} chapters total")
-    print(f"  ✓ Read {len(chapter_contents)} chapters")
-
-    # Assemble the novel (deterministic string concatenation)
-    novel_parts = []
-
-    # Title
-    novel_parts.append(f"# {metadata.title}\n")
-
-    # Introduction
-    novel_parts.append(f"## 简介\n{metadata.introduction}\n")
-
-    # Table of Contents
-    novel_parts.append("## 目录\n")
-    for toc_entry in metadata.table_of_contents:
-        novel_parts.append(toc_entry)
-    novel_parts.append("")  # Empty line after TOC
-
-    # Main content
-    novel_parts.append("## 正文\n")
-    for i, chapter_content in enumerate(chapter_contents, 1):
-        novel_parts.append(chapter_content)
-        if i < len(chapter_contents):
-            novel_parts.append("\n\n")  # Separator between chapters
-
-    # Ending marker
-    novel_parts.append("\n[全书完]")
-
-    final_book_text = "\n".join(novel_parts)
-
-    logger.info(f"Assembled novel: {len(final_book_text)} characters")
-    print(f"  ✓ Assembled {len(final_book_text)} characters")
-    print()
-
-    # ================================================================================
-    # Step 3: Quality review using LLM
-    # ================================================================================
-    # 📝 NOTES:
-    #
-    # 【当前状态】临时注释 - 由于全书文本输入过大（30K字 + StoryBible ≈ 45K tokens）
-    #              导致 LLM 全书评审频繁失败，影响最终文件生成。
-    #
-    # 【问题】1. 输入过大，超出模型单次处理能力
-    #        2. 评审维度过多（伏笔回收、主题、连续性、节奏等）
-    #        3. 评审后无法改进（9章已完成）
-    #        4. 频繁崩溃导致最终文件无法生成
-    #
-    # 【章节级评审】每章已完成 judge_chapter，保证了单章质量 ✅
-    #
-    # 【未来方案】渐进式评审：
-    #   - 阶段1: 全书结构评审（只看大纲，不看正文）
-    #   - 阶段2: 元数据生成和全书组装（必须成功）
-    #   - 阶段3: 可选的全文质量检查（分批或采样）
-    #
-    # 【临时方案】执行轻量级统计检查，确保最终文件能正常生成
-    # ================================================================================
-
-    logger.info("Step 3: Running quality review...")
-    print("Step 3: Running quality review...")
-
-    # ========== LLM 全书评审（已注释）==========
-    # try:
-    #     # Combine chapters for review
-    #     complete_book = "\n\n".join(chapters)
-    #
-    #     final_crew = FinalCrew()
-    #     final_result = final_crew.finalize_book(
-    #         book_text=complete_book,
-    #         story_bible=current_bible,
-    #         story_spec=story_spec
-    #     )
-    #
-    #     final_report = final_result.get('final_report', {})
-    #     success = final_result.get('success', False)
-    #
-    #     # Convert Pydantic report to dict if needed
-    #     if hasattr(final_report, 'model_dump'):
-    #         final_report = final_report.model_dump()
-    #
-    #     logger.info(f"Quality review completed. Passed: {success}")
-    #     print(f"  ✓ Quality review completed. Passed: {success}")
-    #     print()
-    #
-    # except Exception as e:
-    #     logger.warning(f"Quality review failed: {e}")
-    #     print(f"⚠ Quality review failed: {e}")
-    #     final_report = {}
-    #     success = False
-    #     print()
-
-    # ========== 临时替代方案：轻量级统计检查 ==========
+    # Setup base output directory
+    if output_dir is None:
+        base_output_dir = Path("./novels")
+    else:
+        base_output_dir = Path(output_dir)
+    # Resolve once (os.getcwd() only for relative paths); the novel directory
+    # and every artifact path are derived from it, so they're absolute too
+    if not base_output_dir.is_absolute():
+        base_output_dir = base_output_dir.absolute()
+    base_output_dir.mkdir(parents=True, exist_ok=True)
+
+    logger.info("Output directory: %s", base_output_dir)
+
+    # Artifact files are written off the main thread; flushed before Phase 3
+    # reads the chapters back and before the final summary
+    writer = AsyncArtifactWriter()
+    # The writer thread is a daemon: if run() raises, still drain whatever
+    # chapters and artifacts are queued before returning the error
     try:
-        logger.info("Performing lightweight quality check (statistics only)...")
-
-        # 统计检查（不调用 LLM）
-        total_chars = sum(len(chapter) for chapter in chapters)
-        chapter_count = len(chapters)
-        avg_chars = total_chars / chapter_count if chapter_count > 0 else 0
-
-        # 检查章节完整性
-        missing_chapters = [i for i in range(1, 10) if i > len(chapters) or not chapters[i-1].strip()]
-        has_missing = len(missing_chapters) > 0
-
-        # 生成简化的统计报告
-        final_report = {
-            "chapter": None,
-            "word_count": total_chars,
-            "is_whole_book": True,
-            "statistical_summary": {
-                "total_chapters": chapter_count,
-                "average_chapter_length": avg_chars,
-                "missing_chapters": missing_chapters,
-                "all_chapters_present": not has_missing
-            },
-            "note": "LLM-based full book review is temporarily disabled. Chapter-level reviews have been completed for each individual chapter."
+        # Track generation metadata
+        started_at = datetime.now()
+        generation_metadata = {
+            "genre": genre,
+            "theme_statement": theme_statement,
+            "additional_preferences": additional_preferences,
+            "start_time": started_at.isoformat(),
+            "chapters_generated": [],
+            "total_chapters": 9,
+            "novel_name": None,  # Will be set after initialization
+            "novel_dir": None
         }
 
-        # 简化的成功判断
-        success = chapter_count == 9 and not has_missing
-
-        logger.info(f"Quality check completed. Chapters: {chapter_count}/9, All present: {not has_missing}")
-        print(f"  ✓ Quality check completed. Chapters: {chapter_count}/9")
-        print(f"  ℹ️  Note: Full book LLM review is temporarily disabled")
-        print()
-
-    except Exception as e:
-        logger.error(f"Quality check failed: {e}", exc_info=True)
-        print(f"⚠ Quality check failed: {e}")
-        final_report = {}
-        success = False
-        print()
-
-    # ================================================================================
-    # END OF Step 3
-    # ================================================================================
-
-    # Save final book with title-based filename
-    # Sanitize title for filename (remove special characters)
-    safe_title = "".join(c for c in metadata.title if c.isalnum() or c in (' ', '-', '_'))
-    safe_title = safe_title.replace(' ', '_')
-    final_book_file = novel_dir / f"{safe_title}_final.md"
-
-    with open(final_book_file, "w", encoding="utf-8") as f:
-        f.write(final_book_text)
-    logger.info(f"Saved complete novel to {final_book_file}")
-    logger.info(f"Final novel length: {len(final_book_text)} characters")
-    print(f"✓ Saved complete novel to {final_book_file}")
-
-    # Save final report
-    with open(novel_dir / "final_report.json", "w", encoding="utf-8") as f:
-        json.dump(final_report, f, ensure_ascii=False, indent=2)
-    logger.info(f"Saved final report to {novel_dir / 'final_report.json'}")
-    print(f"✓ Saved final report to {novel_dir / 'final_report.json'}")
-
-    # Save metadata for reference
-    metadata_dict = {
-        "title": metadata.title,
-        "introduction": metadata.introduction,
-        "table_of_contents": metadata.table_of_contents
-    }
-    with open(novel_dir / "novel_metadata.json", "w", encoding="utf-8") as f:
-        json.dump(metadata_dict, f, ensure_ascii=False, indent=2)
-    logger.info(f"Saved metadata to {novel_dir / 'novel_metadata.json'}")
-    print(f"✓ Saved metadata to {novel_dir / 'novel_metadata.json'}")
-    print()
-
-    if success:
-        logger.info("✓✓✓ Novel generation complete and passed quality gates! ✓✓✓")
-        print("\\n✓✓✓ Novel generation complete and passed quality gates! ✓✓✓")
-    else:
-        logger.warning("Novel generation complete but did not pass all quality gates")
-        if final_report.get('issues'):
-            logger.warning(f"Issues: {[issue.get('note') for issue in final_report.get('issues', [])]}")
-        print("\\n⚠ Novel generation complete but did not pass all quality gates")
-        if final_report.get('issues'):
-            print(f"  Issues: {[issue.get('note') for issue in final_report.get('issues', [])]}")
-
-    print()
-    print("=" * 80)
-    print("Generation Summary")
-    print("=" * 80)
-    print(f"Novel Name: {novel_name}")
-    print(f"Chapters generated: {len(chapters)}/9")
-    print(f"Quality gate passed: {'Yes' if success else 'No'}")
-    print(f"Novel directory: {novel_dir.absolute()}")
-    print("=" * 80)
-
-    generation_metadata['end_time'] = datetime.now().isoformat()
-    generation_metadata['success'] = success
+        # ==================== PHASE 1: INITIALIZATION ====================
+        logger.info("=" * 80)
+        logger.info("[Phase 1] Initialization - Creating novel name, StorySpec, StoryBible, and Outline")
+        logger.info("=" * 80)
 
-    logger.info("=" * 80)
-    logger.info("Generation Summary")
-    logger.info("=" * 80)
-    logger.info(f"Novel Name: {novel_name}")
-    logger.info(f"Chapters generated: {len(chapters)}/9")
-    logger.info(f"Quality gate passed: {'Yes' if success else 'No'}")
-    logger.info(f"Novel directory: {novel_dir.absolute()}")
-    logger.info(f"Start time: {generation_metadata['start_time']}")
-    logger.info(f"End time: {generation_metadata['end_time']}")
-
-    # ==================== ADD TOKEN USAGE SUMMARY ====================
-    logger.info("=" * 80)
-    logger.info("[TOKEN USAGE] LLM Token Usage Summary")
-    logger.info("=" * 80)
+        init_crew = InitCrew()
+        init_inputs = {
+            "genre": genre,
+            "theme_statement": theme_statement,
+            "additional_preferences": additional_preferences
+        }
 
-    try:
-        from storycrew.crew import get_llm
-        llm_instance = get_llm()
-
-        # Get token usage summary from CrewAI LLM
-        token_summary = llm_instance.get_token_usage_summary()
-
-        if token_summary:
-            total_prompt_tokens = token_summary.get('prompt_tokens', 0)
-            total_completion_tokens = token_summary.get('completion_tokens', 0)
-            total_tokens = token_summary.get('total_tokens', total_prompt_tokens + total_completion_tokens)
-
-            logger.info(f"[TOKEN USAGE] 📊 Total Token Usage:")
-            logger.info(f"[TOKEN USAGE]   Input (prompt):  {total_prompt_tokens:,} tokens")
-            logger.info(f"[TOKEN USAGE]   Output (completion): {total_completion_tokens:,} tokens")
-            logger.info(f"[TOKEN USAGE]   Total: {total_tokens:,} tokens")
-
-            # Calculate cost estimate (rough estimate: $0.50 per 1M input, $1.50 per 1M output)
-            input_cost = (total_prompt_tokens / 1_000_000) * 0.50
-            output_cost = (total_completion_tokens / 1_000_000) * 1.50
-            total_cost = input_cost + output_cost
-            logger.info(f"[TOKEN USAGE]   Est. Total Cost: ${total_cost:.4f}")
-
-            # Also print to console
-            print()
-            print("=" * 80)
-            print("Token Usage Summary")
-            print("=" * 80)
-            print(f"Input tokens:  {total_prompt_tokens:,}")
-            print(f"Output tokens: {total_completion_tokens:,}")
-            print(f"Total tokens:  {total_tokens:,}")
-            print(f"Est. Cost: ${total_cost:.4f}")
-            print("=" * 80)
-
-            # Save to metadata
-            generation_metadata['token_usage'] = {
-                'prompt_tokens': total_prompt_tokens,
-                'completion_tokens': total_completion_tokens,
-                'total_tokens': total_tokens,
-                'estimated_cost_usd': total_cost
-            }
-        else:
-            logger.info("[TOKEN USAGE] No token usage data available (LLM may not support tracking)")
-    except Exception as e:
-        logger.warning(f"[TOKEN USAGE] Could not retrieve token usage summary: {e}")
-    # ==================== END TOKEN USAGE SUMMARY ====================
+        try:
+            logger.info("Starting InitCrew kickoff...")
+            init_result = init_crew.kickoff(inputs=init_inputs)
+            logger.info("InitCrew completed successfully")
 
-    logger.info("=" * 80)
-    logger.info("StoryCrew Novel Generation Completed")
-    logger.info("=" * 80)
+            # Parse novel_name and story_spec from init_result
+            # The result is a dict with Pydantic objects
+            novel_name = init_result.get('novel_name') if isinstance(init_result, dict) else None
+            if isinstance(novel_name, str):
+                # Convert Pydantic objects to JSON-ready dicts in a single pass
+                # (mode='json' lets pydantic-core handle nested models/enums)
+                result_dict = {
+                    k: (v.model_dump(mode='json', exclude_none=True) if isinstance(v, BaseModel) else v)
+                    for k, v in init_result.items()
+                }
 
-    with open(novel_dir / "generation_metadata.json", "w", encoding="utf-8") as f:
-        json.dump(generation_metadata, f, ensure_ascii=False, indent=2)
+                story_spec = result_dict.get('story_spec', {})
+                story_bible = result_dict.get('story_bible', {})
+                outline = result_dict.get('outline', {})
 
-    return {
-        'success': success,
-        'final_book': final_book_text,
-        'metadata': generation_metadata,
-        'novel_name': novel_name,
-        'novel_dir': str(novel_dir.absolute())
-    }
+                # Sanitize novel name for directory (remove special characters)
+                novel_name_sanitized = novel_name.translate(_BAD_PATH_CHARS).strip()
 
+                logger.info("Novel Name extracted: %s", novel_name)
+                logger.info("Sanitized directory name: %s", novel_name_sanitized)
 
-def interactive_input() -> tuple:
-    """
-    Interactive CLI for story generation.
+                # Create novel-specific directory
+                novel_dir = base_output_dir / novel_name_sanitized
+                novel_dir.mkdir(parents=True, exist_ok=True)
 
-    Returns:
-        tuple: (genre, theme_statement, additional_preferences)
-    """
-    print("=" * 80)
-    print("StoryCrew - AI小说自动生成系统")
-    print("=" * 80)
-    print()
-
-    # Genre selection
-    print("请选择小说题材：")
-    print("  1. 都市职场爱情 (romance)")
-    print("  2. 本格/社会派悬疑 (mystery)")
-    print()
-
-    while True:
-        choice = input("请输入选择 (1/2): ").strip()
-        if choice == "1":
-            genre = "romance"
-            genre_name = "都市职场爱情"
-            break
-        elif choice == "2":
-            genre = "mystery"
-            genre_name = "本格/社会派悬疑"
-            break
-        else:
-            print("无效选择，请输入 1 或 2")
+                logger.info("Created novel directory: %s", novel_dir)
 
-    print(f"✓ 已选择题材：{genre_name}")
-    print()
+            else:
+                logger.warning(
+                    "Could not parse novel_name from result (got %s), using default naming",
+                    type(init_result).__name__
+                )
+                novel_name = f"{genre}_novel_{started_at:%Y%m%d_%H%M%S}"
+                novel_dir = base_output_dir / novel_name
+                novel_dir.mkdir(parents=True, exist_ok=True)
+
+                story_spec = init_inputs
+                story_bible = init_inputs
+                outline = init_inputs
 
-    # Theme input
-    print("请输入小说主题（建议100字左右，描述你想写的故事核心）：")
-    print("提示：可以是人物关系、核心冲突、或者一句话概括的故事梗概")
-    print()
+            # Update metadata
+            generation_metadata['novel_name'] = novel_name
+            generation_metadata['novel_dir'] = str(novel_dir)
 
-    while True:
-        theme = input("主题: ").strip()
-        if len(theme) > 0:
-            break
-        print("主题不能为空，请重新输入")
+            # Save initialization outputs to novel directory
+            story_spec_file = novel_dir / "story_spec.json"
+            writer.submit_json(story_spec_file, story_spec)
+            logger.info("Saved StorySpec to %s", story_spec_file)
 
-    print(f"✓ 主题：{theme}")
-    print()
+            story_bible_file = novel_dir / "story_bible.json"
+            writer.submit_json(story_bible_file, story_bible)
+            logger.info("Saved StoryBible to %s", story_bible_file)
 
-    # Optional preferences
-    print("可选：其他偏好要求（如特定人物设定、故事风格等，直接回车跳过）")
-    preferences = input("偏好: ").strip()
+            outline_file = novel_dir / "outline.json"
+            writer.submit_json(outline_file, outline)
+            logger.info("Saved Outline to %s", outline_file)
 
-    if preferences:
-        print(f"✓ 偏好：{preferences}")
-    else:
-        print("✓ 无额外偏好")
-    print()
+        except Exception as e:
+            logger.error("Initialization failed: %s", e, exc_info=True)
+            raise
+
+        # Chapter file paths, built once: written in Phase 2, read back in Phase 3
+        chapter_paths = [novel_dir / f"chapter_{i:02d}.md" for i in range(1, 10)]
+        review_paths = [novel_dir / f"chapter_{i:02d}_needs_review.md" for i in range(1, 10)]
+
+        # ==================== PHASE 2: CHAPTER GENERATION LOOP ====================
+        logger.info("=" * 80)
+        logger.info("[Phase 2] Chapter Generation - Writing 9 chapters with quality gates")
+        logger.info("=" * 80)
+
+        chapter_crew = ChapterCrew()
+        chapter_lengths, saved_titles, cached_bible = _generate_chapters(
+            chapter_crew, outline, CachedModel(story_bible), story_spec, chapter_paths, review_paths,
+            writer, get_token_usage_total, generation_metadata, logger
+        )
 
-    return genre, theme, preferences
+        # Save updated StoryBible
+        logger.info("Saving final StoryBible...")
+        # Written synchronously: this is the recovery state if a later phase fails
+        current_bible = cached_bible.to_dict()
+        bible_final_file = novel_dir / "story_bible_final.json"
+        bible_final_file.write_bytes(cached_bible.to_json_bytes())
+        logger.info("Saved final StoryBible to %s", bible_final_file)
+
+        # Phase 3 reads the chapter files back from disk
+        _log_write_failures(writer.flush(), logger)
+
+        # ==================== PHASE 3: FINAL ASSEMBLY ====================
+        logger.info("=" * 80)
+        logger.info("[Phase 3] Final Assembly - Generate metadata and assemble novel")
+        logger.info("=" * 80)
+
+        # Step 1: Generate metadata using LLM (title, introduction, TOC)
+        logger.info("Step 1: Generating novel metadata (title, introduction, TOC)...")
+
+        # Chapter titles for metadata generation, recorded as the chapters were
+        # saved (no need to read the files back)
+        chapter_titles = [saved_titles.get(i) or f"第{i}章" for i in range(1, 10)]
+
+        def generate_metadata():
+            base_crew = Storycrew()
+
+            # Create metadata generation task
+            metadata_task = base_crew.generate_novel_metadata()
+            metadata_task.agent = base_crew.line_editor()
+
+            # Prepare inputs (story_spec and current_bible are already plain dicts:
+            # dumped once from the InitCrew result and by the CachedModel)
+            metadata_inputs = {
+                "story_spec": story_spec,
+                "story_bible": current_bible,
+                "chapter_titles": chapter_titles
+            }
 
+            # Execute metadata generation
+            metadata_crew = Crew(
+                agents=[base_crew.line_editor()],
+                tasks=[metadata_task],
+                process=Process.sequential,
+                verbose=True
+            )
+            metadata = metadata_crew.kickoff(inputs=metadata_inputs).pydantic  # NovelMetadata object
+            if metadata is None:
+                raise ValueError("metadata task returned no structured output")
+            return metadata
+
+        # Chapter scan and statistics don't need the metadata; they run while the
+        # metadata LLM call is in flight
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            metadata_future = pool.submit(generate_metadata)
+            chapter_files, chapter_stats = _prepare_assembly(novel_dir, chapter_paths, chapter_lengths, logger)
+
+            try:
+                metadata = metadata_future.result()
+            except Exception as e:
+                logger.warning("Metadata generation failed: %s, using fallback", e)
+                # Fallback metadata (built without validation: it is assembled locally)
+                metadata = NovelMetadata.model_construct(
+                    title=novel_name,
+                    introduction=f"《{novel_name}》是一部九章节的小说。",
+                    table_of_contents=chapter_titles
+                )
+            else:
+                logger.info("Generated metadata:")
+                logger.info("  Title: %s", metadata.title)
+                logger.info("  Introduction: %s...", metadata.introduction[:100])
+                logger.info("  TOC: %s chapters", len(metadata.table_of_contents))
+
+        # Step 2: Assemble complete novel using Python (deterministic, fast, complete)
+        logger.info("Step 2: Assembling complete novel...")
+
+        # Save final book with title-based filename
+        # Sanitize title for filename (remove special characters)
+        safe_title = _TITLE_UNSAFE_CHARS.sub('', metadata.title).replace(' ', '_')
+        final_book_file = novel_dir / f"{safe_title}_final.md"
+
+        chapters_read = len(chapter_files)
+
+        # Stream the novel straight into one buffered file; writelines pulls one
+        # chunk at a time, so the whole book is never held in memory
+        with open(final_book_file, "wb", buffering=_ASSEMBLY_BUFFER_SIZE) as out:
+            out.writelines(_iter_novel(metadata, chapter_files))
+            final_book_size = out.tell()
+
+        logger.info("Read %s chapters total", chapters_read)
+
+        logger.info("Saved complete novel to %s", final_book_file)
+        logger.info("Assembled novel: %s bytes", final_book_size)
+
+        # ================================================================================
+        # Step 3: Quality review using LLM
+        # ================================================================================
+        # 📝 NOTES:
+        #
+        # 【当前状态】临时注释 - 由于全书文本输入过大（30K字 + StoryBible ≈ 45K tokens）
+        #              导致 LLM 全书评审频繁失败，影响最终文件生成。
+        #
+        # 【问题】1. 输入过大，超出模型单次处理能力
+        #        2. 评审维度过多（伏笔回收、主题、连续性、节奏等）
+        #        3. 评审后无法改进（9章已完成）
+        #        4. 频繁崩溃导致最终文件无法生成
+        #
+        # 【章节级评审】每章已完成 judge_chapter，保证了单章质量 ✅
+        #
+        # 【未来方案】渐进式评审：
+        #   - 阶段1: 全书结构评审（只看大纲，不看正文）
+        #   - 阶段2: 元数据生成和全书组装（必须成功）
+        #   - 阶段3: 可选的全文质量检查（分批或采样）
+        #
+        # 【临时方案】执行轻量级统计检查，确保最终文件能正常生成
+        # ================================================================================
+
+        logger.info("Step 3: Running quality review...")
+
+        # ========== LLM 全书评审（已注释）==========
+        # 恢复时：评审与 Step 1 的元数据调用没有数据依赖，应与 metadata_crew.kickoff
+        # 一起提交到 Step 1 的线程池（或 asyncio.gather 配合 FinalCrew.finalize_book_async），
+        # 而不是在元数据之后串行执行。
+        # try:
+        #     # Review the book exactly as assembled in Step 2 (chapter texts are
+        #     # not kept in memory, and re-joining them would build a second copy)
+        #     complete_book = final_book_file.read_text(encoding="utf-8")
+        #
+        #     final_crew = FinalCrew()
+        #     final_result = final_crew.finalize_book(
+        #         book_text=complete_book,
+        #         story_bible=current_bible,
+        #         story_spec=story_spec
+        #     )
+        #
+        #     final_report = final_result.get('final_report', {})
+        #     success = final_result.get('success', False)
+        #
+        #     # Convert Pydantic report to dict if needed
+        #     if hasattr(final_report, 'model_dump'):
+        #         final_report = final_report.model_dump()
+        #
+        #     logger.info("Quality review completed. Passed: %s", success)
+        #     print(f"  ✓ Quality review completed. Passed: {success}")
+        #     print()
+        #
+        # except Exception as e:
+        #     logger.warning("Quality review failed: %s", e)
+        #     print(f"⚠ Quality review failed: {e}")
+        #     final_report = {}
+        #     success = False
+        #     print()
+
+        # ========== 临时替代方案：轻量级统计检查 ==========
+        try:
+            logger.info("Performing lightweight quality check (statistics only)...")
+
+            # 统计检查（不调用 LLM）
+            total_chars = chapter_stats['total_chars']
+            chapter_count = chapter_stats['chapter_count']
+            avg_chars = chapter_stats['average_chapter_length']
+
+            # 检查章节完整性
+            missing_chapters = chapter_stats['missing_chapters']
+            has_missing = len(missing_chapters) > 0
+
+            # 生成简化的统计报告
+            final_report = {
+                "chapter": None,
+                "word_count": total_chars,
+                "is_whole_book": True,
+                "statistical_summary": {
+                    "total_chapters": chapter_count,
+                    "average_chapter_length": avg_chars,
+                    "missing_chapters": missing_chapters,
+                    "all_chapters_present": not has_missing
+                },
+                "note": "LLM-based full book review is temporarily disabled. Chapter-level reviews have been completed for each individual chapter."
+            }
 
-def main():
-    """
-    Main entry point for command-line usage.
+            # 简化的成功判断
+            success = chapter_count == 9 and not has_missing
 
-    Interactive mode (default):
-        python -m storycrew.main
+            logger.info("Quality check completed. Chapters: %s/9, All present: %s", chapter_count, not has_missing)
+            logger.info("Note: Full book LLM review is temporarily disabled")
 
-    Command-line mode (for scripting):
-        python -m storycrew.main --genre romance --theme "..."
-    """
-    import argparse
+        except Exception as e:
+            logger.error("Quality check failed: %s", e, exc_info=True)
+            final_report = {}
+            success = False
+
+        # ================================================================================
+        # END OF Step 3
+        # ================================================================================
+
+        # Save final report
+        final_report_file = novel_dir / "final_report.json"
+        writer.submit_json(final_report_file, final_report)
+        logger.info("Saved final report to %s", final_report_file)
+
+        # Save metadata for reference
+        metadata_file = novel_dir / "novel_metadata.json"
+        writer.submit_text(metadata_file, metadata.model_dump_json(indent=2, exclude_none=True))
+        logger.info("Saved metadata to %s", metadata_file)
+
+        if success:
+            logger.info("✓✓✓ Novel generation complete and passed quality gates! ✓✓✓")
+        else:
+            issue_notes = [issue.get('note') for issue in final_report.get('issues', [])]
+            logger.warning("Novel generation complete but did not pass all quality gates")
+            if issue_notes:
+                logger.warning("Issues: %s", issue_notes)
+
+        _log_write_failures(writer.flush(), logger)
+
+        rule = "=" * 80
+        sys.stdout.write(
+            f"\n{rule}\nGeneration Summary\n{rule}\n"
+            f"Novel Name: {novel_name}\n"
+            f"Chapters generated: {len(chapter_lengths)}/9\n"
+            f"Quality gate passed: {'Yes' if success else 'No'}\n"
+            f"Novel directory: {novel_dir}\n"
+            f"{rule}\n"
+        )
 
-    parser = argparse.ArgumentParser(
-        description="StoryCrew: Generate novels with CrewAI"
-    )
-    parser.add_argument(
-        "--genre",
-        type=str,
-        choices=["romance", "mystery"],
-        help="Story genre (skip for interactive mode)"
-    )
-    parser.add_argument(
-        "--theme",
-        type=str,
-        help="Core theme of the story (skip for interactive mode)"
-    )
-    parser.add_argument(
-        "--preferences",
-        type=str,
-        default="",
-        help="Additional user preferences"
-    )
-    parser.add_argument(
-        "--output",
-        type=str,
-        default=None,
-        help="Base output directory (default: ./novels)"
-    )
+        generation_metadata['end_time'] = datetime.now().isoformat()
+        generation_metadata['success'] = success
 
-    args = parser.parse_args()
+        logger.info("=" * 80)
+        logger.info("Generation Summary")
+        logger.info("=" * 80)
+        logger.info("Novel Name: %s", novel_name)
+        logger.info("Chapters generated: %s/9", len(chapter_lengths))
+        logger.info("Quality gate passed: %s", 'Yes' if success else 'No')
+        logger.info("Novel directory: %s", novel_dir)
+        logger.info("Start time: %s", generation_metadata['start_time'])
+        logger.info("End time: %s", generation_metadata['end_time'])
 
-    # Interactive mode if no genre/theme provided
-    if not args.genre or not args.theme:
-        genre, theme, preferences = interactive_input()
-        additional_preferences = preferences or args.preferences
-        base_output_dir = args.output or "./novels"
-    else:
-        # Command-line mode
-        genre = args.genre
-        theme = args.theme
-        additional_preferences = args.preferences
-        base_output_dir = args.output or "./novels"
+        # ==================== ADD TOKEN USAGE SUMMARY ====================
+        logger.info("=" * 80)
+        logger.info("[TOKEN USAGE] LLM Token Usage Summary")
+        logger.info("=" * 80)
 
-    try:
-        result = run(
-            genre=genre,
-            theme_statement=theme,
-            additional_preferences=additional_preferences,
-            output_dir=base_output_dir
+        try:
+            llm_instance = get_llm()
+
+            # Get token usage summary from CrewAI LLM
+            token_summary = llm_instance.get_token_usage_summary()
+
+            if token_summary:
+                total_prompt_tokens = token_summary.get('prompt_tokens', 0)
+                total_completion_tokens = token_summary.get('completion_tokens', 0)
+                total_tokens = token_summary.get('total_tokens', total_prompt_tokens + total_completion_tokens)
+
+                logger.info("[TOKEN USAGE] 📊 Total Token Usage:")
+                logger.info("[TOKEN USAGE]   Input (prompt):  %s tokens", format(total_prompt_tokens, ','))
+                logger.info("[TOKEN USAGE]   Output (completion): %s tokens", format(total_completion_tokens, ','))
+                logger.info("[TOKEN USAGE]   Total: %s tokens", format(total_tokens, ','))
+
+                # Calculate cost estimate (rough estimate: $0.50 per 1M input, $1.50 per 1M output)
+                input_cost = (total_prompt_tokens / 1_000_000) * 0.50
+                output_cost = (total_completion_tokens / 1_000_000) * 1.50
+                total_cost = input_cost + output_cost
+                logger.info("[TOKEN USAGE]   Est. Total Cost: $%.4f", total_cost)
+
+                # Save to metadata
+                generation_metadata['token_usage'] = {
+                    'prompt_tokens': total_prompt_tokens,
+                    'completion_tokens': total_completion_tokens,
+                    'total_tokens': total_tokens,
+                    'estimated_cost_usd': total_cost
+                }
+            else:
+                logger.info("[TOKEN USAGE] No token usage data available (LLM may not support tracking)")
+        except Exception as e:
+            logger.warning("[TOKEN USAGE] Could not retrieve token usage summary: %s", e)
+        # ==================== END TOKEN USAGE SUMMARY ====================
+
+        # Compact by default: this file grows with every chapter and is read by tools,
+        # not people. STORYCREW_PRETTY_METADATA=1 restores the indented layout.
+        writer.submit_json(
+            novel_dir / "generation_metadata.json", generation_metadata,
+            pretty=os.getenv("STORYCREW_PRETTY_METADATA") == "1"
         )
-        return 0 if result['success'] else 1
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
+        _log_write_failures(writer.close(), logger)
+    finally:
+        writer.close()
+
+    # The ruled banner is console decoration only; the log file gets one line.
+    # Some stdout replacements (Jupyter, pytest capsys, StringIO) have no .buffer
+    logger.info("StoryCrew Novel Generation Completed")
+    sys.stdout.flush()
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if stdout_buffer is not None:
+        stdout_buffer.write(_COMPLETION_BANNER)
+        stdout_buffer.flush()
+    else:
+        sys.stdout.write(_COMPLETION_BANNER.decode('utf-8'))
+        sys.stdout.flush()
+
+    return _RunResult({
+        'success': success,
+        'final_book_file': str(final_book_file),
+        'metadata': generation_metadata,
+        'novel_name': novel_name,
+        'novel_dir': generation_metadata['novel_dir']
+    })
+
+
+# The command-line entry point lives in storycrew._cli; re-exported here so
+# `python -m storycrew.main` and existing `from storycrew.main import main` work
+from storycrew._cli import main  # noqa: E402
 
 
 if __name__ == "__main__":
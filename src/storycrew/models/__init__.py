@@ -5,6 +5,7 @@ from .scene_list import SceneList, Scene
 from .judge_report import JudgeReport, ScoreBreakdown, Issue
 from .retry_level import RetryLevel, determine_retry_level
 from .chapter_generation_state import ChapterGenerationState
+from .cached_model import CachedModel
 from .concept import Concept, WorkplaceEcosystem, SuspectPool
 from .chapter import ChapterOutput
 from .book import BookOutline, NovelMetadata, TruthCard
@@ -30,6 +31,7 @@ __all__ = [
     "RetryLevel",
     "determine_retry_level",
     "ChapterGenerationState",
+    "CachedModel",
     "Concept",
     "WorkplaceEcosystem",
     "SuspectPool",
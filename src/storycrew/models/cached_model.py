@@ -0,0 +1,46 @@
+"""Serialization cache for models reused across chapters."""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from storycrew.tools.fast_json import as_plain, dumps_pretty
+
+
+@dataclass
+class CachedModel:
+    """缓存模型的 dict / JSON 序列化结果
+
+    current_bible 在一次运行中只会被整体替换（每章一次），不会原地修改，
+    所以在两次 update() 之间它的 model_dump / JSON 结果可以复用。
+
+    Attributes:
+        model: Pydantic 模型，或已经 dump 好的 dict
+        version: 每次 update() 加 1，可用来判断内容是否变化
+    """
+
+    model: Any
+    version: int = 0
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    _json_cache: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+    def update(self, model: Any) -> None:
+        """替换模型并使缓存失效"""
+        self.model = model
+        self.version += 1
+        self._dict_cache = None
+        self._json_cache = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """返回 model_dump() 结果（同一版本只计算一次，调用方不得修改）"""
+        if self._dict_cache is None:
+            self._dict_cache = as_plain(self.model)
+        return self._dict_cache
+
+    def to_json_bytes(self) -> bytes:
+        """返回带缩进的 UTF-8 JSON 字节串（同一版本只计算一次，可直接 write_bytes）"""
+        if self._json_cache is None:
+            self._json_cache = dumps_pretty(self.model)
+        return self._json_cache
+
+    def to_json(self) -> str:
+        """返回带缩进的 JSON 字符串"""
+        return self.to_json_bytes().decode('utf-8')
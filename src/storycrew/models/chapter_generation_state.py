@@ -1,8 +1,9 @@
 """Chapter generation state model for tracking intermediate results."""
 from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from storycrew.models.retry_level import RetryLevel
+from storycrew.models.scene_list import SceneList
 
 
 class ChapterGenerationState(BaseModel):
@@ -40,10 +41,38 @@ class ChapterGenerationState(BaseModel):
     write_retry_count: int = 0
     """WRITE_ONLY 级别的连续重试计数（用于升级到 FULL_RETRY）"""
 
+    # set_scene_list 记住的 SceneList 对象，以及它对应的那份 scene_list 字符串
+    _scene_list_obj: Optional[SceneList] = PrivateAttr(default=None)
+    _scene_list_json: Optional[str] = PrivateAttr(default=None)
+
+    def set_scene_list(self, scene_list: SceneList) -> None:
+        """保存 SceneList：只 dump 一次 JSON，同时保留对象本身
+
+        Args:
+            scene_list: plan_chapter 输出的 SceneList
+        """
+        self.scene_list = scene_list.model_dump_json()
+        self._scene_list_obj = scene_list
+        self._scene_list_json = self.scene_list
+
+    def get_scene_list(self) -> Optional[SceneList]:
+        """返回 scene_list 对应的 SceneList 对象
+
+        scene_list 未被直接改写时复用 set_scene_list 保存的对象；
+        否则用 construct_trusted 从字符串重建一次并缓存。
+        """
+        if not self.scene_list:
+            return None
+        if self._scene_list_json is not self.scene_list:
+            self._scene_list_obj = SceneList.construct_trusted(self.scene_list)
+            self._scene_list_json = self.scene_list
+        return self._scene_list_obj
+
     def to_preserve(self, retry_level: RetryLevel) -> Dict[str, Any]:
         """根据重试级别返回需要保留的输入字段
 
         将 state 中的数据转换为 inputs 字典，用于传递给下一轮重试。
+        scene_list 直接返回已保存的 JSON 字符串，不会重新序列化。
 
         Args:
             retry_level: 下一次重试使用的级别
@@ -1,6 +1,7 @@
 """Retry level models for selective chapter generation retry."""
 from enum import Enum
-from typing import Set, List, Optional
+from functools import lru_cache
+from typing import FrozenSet, Set, List, Optional
 
 from storycrew.models.judge_report import JudgeReport, Issue
 
@@ -51,6 +52,10 @@ class RetryLevel(Enum):
             return ["plan_chapter", "write_chapter", "edit_chapter", "judge_chapter"]
 
 
+# Issue.severity 从轻到重的排序，用于在一次遍历中找出最严重的 safety 问题
+_SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+
 def determine_retry_level(judge_report: JudgeReport, attempt: int) -> RetryLevel:
     """根据 JudgeReport 的 issues 类型确定重试级别
 
@@ -64,6 +69,36 @@ def determine_retry_level(judge_report: JudgeReport, attempt: int) -> RetryLevel
         judge_report: Judge 质量报告
         attempt: 当前尝试次数（0-based）
 
+    Returns:
+        RetryLevel: 确定的重试级别
+    """
+    # 一次遍历同时收集问题类型和最严重的 safety 级别，结果只取决于这两者和 attempt
+    issue_types = set()
+    safety_severity = None
+    for issue in judge_report.issues:
+        issue_types.add(issue.type)
+        if issue.type == "safety" and (
+            safety_severity is None
+            or _SEVERITY_RANK.get(issue.severity, 0) > _SEVERITY_RANK.get(safety_severity, 0)
+        ):
+            safety_severity = issue.severity
+
+    return _determine_retry_level_cached(frozenset(issue_types), safety_severity, attempt)
+
+
+@lru_cache(maxsize=256)
+def _determine_retry_level_cached(
+    issue_types: FrozenSet[str],
+    safety_severity: Optional[str],
+    attempt: int
+) -> RetryLevel:
+    """determine_retry_level 的纯函数部分（问题类型和 severity 都是有限集合，可缓存）
+
+    Args:
+        issue_types: 所有问题类型
+        safety_severity: 最严重的 safety 问题级别，没有 safety 问题时为 None
+        attempt: 当前尝试次数（0-based）
+
     Returns:
         RetryLevel: 确定的重试级别
     """
@@ -71,9 +106,6 @@ def determine_retry_level(judge_report: JudgeReport, attempt: int) -> RetryLevel
     if attempt >= 2:
         return RetryLevel.FULL_RETRY
 
-    # 提取所有问题类型
-    issue_types = {issue.type for issue in judge_report.issues}
-
     # 优先级：FULL_RETRY > WRITE_ONLY > EDIT_ONLY
 
     # 1. structure 问题 → FULL_RETRY
@@ -81,9 +113,8 @@ def determine_retry_level(judge_report: JudgeReport, attempt: int) -> RetryLevel
         return RetryLevel.FULL_RETRY
 
     # 2. safety 问题：根据严重程度
-    if "safety" in issue_types:
-        safety_issues = [i for i in judge_report.issues if i.type == "safety"]
-        if any(i.severity in ["high", "critical"] for i in safety_issues):
+    if safety_severity is not None:
+        if safety_severity in ("high", "critical"):
             return RetryLevel.FULL_RETRY
         else:
             # 低严重级别的 safety 问题可通过编辑修正
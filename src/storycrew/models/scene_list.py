@@ -1,7 +1,9 @@
 """Scene list models for detailed chapter planning."""
-from typing import List, Optional
+from typing import List, Optional, Union
 from pydantic import BaseModel, Field
 
+from storycrew.tools.fast_json import loads
+
 
 class Scene(BaseModel):
     """Detailed scene information."""
@@ -46,5 +48,16 @@ class SceneList(BaseModel):
     chapter_goal: str = ""
     required_emotional_arc: str = ""
 
+    @classmethod
+    def construct_trusted(cls, json_data: Union[str, bytes]) -> "SceneList":
+        """从本程序自己序列化的 JSON 重建 SceneList，不做校验
+
+        只用于重试时还原 ChapterGenerationState.scene_list 这类已经校验过的数据；
+        LLM 输出仍然走 model_validate / model_validate_json。
+        """
+        data = loads(json_data)
+        scenes = [Scene.model_construct(**scene) for scene in data.pop("scenes", [])]
+        return cls.model_construct(scenes=scenes, **data)
+
     class Config:
         json_encoders = {}
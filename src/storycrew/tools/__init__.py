@@ -1,8 +1,11 @@
 """StoryCrew Tools Package
 
-提供文本处理、字数统计等工具函数。
+提供文本处理、字数统计、跨章节统计、限流、JSON 序列化等工具函数。
 """
 
 from .word_counter import count_chinese_words, analyze_text_statistics
+from .chapter_stats import summarize_chapter_lengths
+from .rate_limiter import TPM_BUDGET_ENV, TPMWindowLimiter, is_transient_error
+from .fast_json import as_plain, dumps_pretty, dumps_compact, loads
 
-__all__ = ['count_chinese_words', 'analyze_text_statistics']
+__all__ = ['count_chinese_words', 'analyze_text_statistics', 'summarize_chapter_lengths', 'TPM_BUDGET_ENV', 'TPMWindowLimiter', 'is_transient_error', 'as_plain', 'dumps_pretty', 'dumps_compact', 'loads']
@@ -0,0 +1,53 @@
+"""跨章节统计工具
+
+Phase 3 的轻量级质量检查（不调用 LLM）在这里计算全书统计。
+每章的指标排成按章节号对齐的数组，安装了 NumPy 时整体做向量化归约，
+以后增加的逐章指标（句长、词汇多样性等）可以沿用同一结构；
+没有 NumPy 时回退到纯 Python，结果一致。
+"""
+import functools
+from typing import Any, Dict, Mapping
+
+
+@functools.lru_cache(maxsize=1)
+def _np():
+    """首次使用时导入 NumPy；未安装时返回 None"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def summarize_chapter_lengths(chapter_lengths: Mapping[int, int], total_chapters: int = 9) -> Dict[str, Any]:
+    """汇总各章长度
+
+    Args:
+        chapter_lengths: {章节号(1 起): 字符数}，空白章节记为 0，未生成的章节不出现
+        total_chapters: 全书应有的章节数
+
+    Returns:
+        Dict: total_chars、chapter_count（已生成章节数，含空白章节）、
+              average_chapter_length、missing_chapters（缺失或空白的章节号）
+    """
+    chapter_count = len(chapter_lengths)
+    np = _np()
+
+    if np is not None:
+        lengths = np.fromiter(
+            (chapter_lengths.get(i, 0) for i in range(1, total_chapters + 1)),
+            dtype=np.int64,
+            count=total_chapters
+        )
+        total_chars = int(lengths.sum())
+        missing_chapters = (np.flatnonzero(lengths == 0) + 1).tolist()
+    else:
+        total_chars = sum(chapter_lengths.get(i, 0) for i in range(1, total_chapters + 1))
+        missing_chapters = [i for i in range(1, total_chapters + 1) if not chapter_lengths.get(i)]
+
+    return {
+        'total_chars': total_chars,
+        'chapter_count': chapter_count,
+        'average_chapter_length': total_chars / chapter_count if chapter_count > 0 else 0,
+        'missing_chapters': missing_chapters,
+    }
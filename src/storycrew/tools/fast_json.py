@@ -0,0 +1,92 @@
+"""JSON 序列化工具
+
+产物文件（story_spec.json、story_bible.json 等）统一走这里：
+安装了 orjson（可选依赖 storycrew[fast]）时用 orjson，否则回退到标准库 json。
+两条路径的输出格式一致：UTF-8、不转义中文、2 空格缩进（dumps_compact 不缩进）。
+反序列化（loads）同理。
+"""
+import json
+from typing import Any, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_COMPACT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | _ORJSON_COMPACT_OPTIONS
+
+
+def as_plain(obj: Any) -> Any:
+    """Pydantic 模型返回 model_dump()，其他对象原样返回
+
+    用 isinstance 判断而不是 hasattr(obj, 'model_dump')：后者每次都要走一遍
+    属性查找（找不到时还要抛出并吞掉 AttributeError）。
+    """
+    return obj.model_dump() if isinstance(obj, BaseModel) else obj
+
+
+def _default(obj: Any) -> Any:
+    """把 Pydantic 对象转换成可序列化的 dict"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """序列化为带缩进的 UTF-8 JSON 字节串
+
+    顶层是 Pydantic 对象时直接用 model_dump_json（Rust 实现），不经过 dict 中转。
+
+    Args:
+        obj: 待序列化的对象（dict/list/Pydantic 对象）
+
+    Returns:
+        bytes: UTF-8 编码的 JSON，可直接 write_bytes
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump_json(indent=2).encode('utf-8')
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib handles those
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=_default).encode('utf-8')
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """序列化为紧凑（无缩进、无多余空格）的 UTF-8 JSON 字节串
+
+    用于只给程序读取、体积会随章节数增长的文件（如 generation_metadata.json）。
+
+    Args:
+        obj: 待序列化的对象（dict/list/Pydantic 对象）
+
+    Returns:
+        bytes: UTF-8 编码的 JSON，可直接 write_bytes
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump_json().encode('utf-8')
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_COMPACT_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """反序列化 JSON 字符串或 UTF-8 字节串（有 orjson 时走 orjson）
+
+    Args:
+        data: JSON 文本（str 或 bytes）
+
+    Returns:
+        Any: 解析出的 dict/list 等 Python 对象
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
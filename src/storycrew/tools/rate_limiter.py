@@ -0,0 +1,95 @@
+"""按 token 计量的限流器
+
+用滑动窗口代替章节之间固定的 time.sleep：
+- 记录最近 60 秒内每一章实际消耗的 token（时间戳, token 数）
+- 下一章开始前，若 窗口内已用 + 预计消耗 会超过 预算 × 0.9，
+  只等到窗口里最早的一条记录过期为止，然后重新判断
+- 预算有余量时完全不等待
+"""
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+# 环境变量：模型的每分钟 token 预算，未设置或 <= 0 时不限流
+TPM_BUDGET_ENV = "MODEL_TPM_BUDGET"
+
+# 只用到预算的 90%，给估算误差和其他进程留余量
+DEFAULT_HEADROOM = 0.9
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """是否为限流或超时错误（等一会儿再整体重试即可恢复）
+
+    按异常类型名判断（RateLimitError / *Timeout*），不依赖具体的 LLM 客户端库；
+    消息里带 "rate limit" 的也算。
+    """
+    if isinstance(error, TimeoutError) or "Timeout" in type(error).__name__:
+        return True
+    return "RateLimitError" in type(error).__name__ or "rate limit" in str(error).lower()
+
+
+class TPMWindowLimiter:
+    """基于 60 秒滑动窗口的 TPM 限流器（单位：token）"""
+
+    def __init__(
+        self,
+        tokens_per_minute: float,
+        window: float = 60.0,
+        headroom: float = DEFAULT_HEADROOM
+    ):
+        self.limit = float(tokens_per_minute) * headroom
+        self.window = window
+        self._events: Deque[Tuple[float, int]] = deque()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, env_var: str = TPM_BUDGET_ENV) -> Optional["TPMWindowLimiter"]:
+        """从环境变量读取 TPM 预算；未配置时返回 None（不限流）"""
+        raw = os.getenv(env_var, "").strip()
+        try:
+            budget = float(raw) if raw else 0.0
+        except ValueError:
+            return None
+        return cls(budget) if budget > 0 else None
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._events and self._events[0][0] <= cutoff:
+            self._used -= self._events.popleft()[1]
+
+    @property
+    def used(self) -> int:
+        """当前窗口内已消耗的 token 数"""
+        self._expire(time.monotonic())
+        return self._used
+
+    def record(self, tokens: int) -> None:
+        """记录一次实际消耗"""
+        if tokens > 0:
+            self._events.append((time.monotonic(), tokens))
+            self._used += tokens
+
+    def acquire(self, expected_tokens: int = 0) -> float:
+        """阻塞等待窗口内有足够余量容纳 expected_tokens
+
+        窗口为空时总是放行（单次预计消耗超过预算时也不会死等）。
+
+        Args:
+            expected_tokens: 下一步预计消耗的 token 数
+
+        Returns:
+            float: 实际等待的秒数（未等待时为 0）
+        """
+        waited = 0.0
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                if not self._events or self._used + expected_tokens <= self.limit:
+                    return waited
+                delay = self._events[0][0] + self.window - now
+                time.sleep(delay)
+                waited += delay
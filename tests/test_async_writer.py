@@ -0,0 +1,58 @@
+"""Tests for AsyncArtifactWriter flushing and failure reporting."""
+import json
+import logging
+
+from storycrew.io import AsyncArtifactWriter
+
+
+def test_close_flushes_queued_artifacts(tmp_path):
+    """close() should return only after every queued file is on disk"""
+    writer = AsyncArtifactWriter()
+    writer.submit_text(tmp_path / "chapter_01.md", "第一章 正文")
+    writer.submit_json(tmp_path / "story_spec.json", {"标题": "测试", "chapters": 9})
+    writer.submit_json(tmp_path / "generation_metadata.json", {"a": 1}, pretty=False)
+
+    assert writer.close() == []
+    assert (tmp_path / "chapter_01.md").read_text(encoding="utf-8") == "第一章 正文"
+    spec_text = (tmp_path / "story_spec.json").read_text(encoding="utf-8")
+    assert json.loads(spec_text) == {"标题": "测试", "chapters": 9}
+    assert "标题" in spec_text  # not ASCII-escaped
+    assert (tmp_path / "generation_metadata.json").read_bytes() == b'{"a":1}'
+
+def test_close_reports_failed_writes(tmp_path):
+    """Failed writes should be returned by close() without stopping later writes"""
+    missing_dir_file = tmp_path / "missing" / "chapter_01.md"
+    unserializable_file = tmp_path / "report.json"
+
+    writer = AsyncArtifactWriter()
+    writer.submit_text(missing_dir_file, "正文")
+    writer.submit_json(unserializable_file, {"bad": object()})
+    writer.submit_text(tmp_path / "chapter_02.md", "第二章")
+    failures = writer.close()
+
+    assert [path for path, _ in failures] == [missing_dir_file, unserializable_file]
+    assert isinstance(failures[0][1], OSError)
+    assert isinstance(failures[1][1], TypeError)
+    assert (tmp_path / "chapter_02.md").read_text(encoding="utf-8") == "第二章"
+
+def test_flush_returns_failures_once(tmp_path):
+    """flush() should hand each failure back once and keep the writer usable"""
+    writer = AsyncArtifactWriter()
+    writer.submit_text(tmp_path / "missing" / "a.md", "x")
+    assert len(writer.flush()) == 1
+    writer.submit_text(tmp_path / "b.md", "y")
+    assert writer.close() == []
+    assert (tmp_path / "b.md").exists()
+
+def test_close_is_idempotent():
+    """A second close() (e.g. from atexit) should be a no-op"""
+    writer = AsyncArtifactWriter()
+    assert writer.close() == []
+    assert writer.close() == []
+
+def test_context_manager_logs_failures(tmp_path, caplog):
+    """Leaving the with-block should close the writer and log failed writes"""
+    with caplog.at_level(logging.ERROR, logger="StoryCrew"):
+        with AsyncArtifactWriter() as writer:
+            writer.submit_text(tmp_path / "missing" / "a.md", "x")
+    assert "Artifact not written" in caplog.text
@@ -797,3 +797,43 @@ def test_max_retries_exhausted(
         assert result["attempts"] == 3  # max_retries (2) + 1
         assert result.get("success") is False
         assert not result["judge_report"].passed
+
+
+def test_rate_limit_error_is_left_to_caller(chapter_crew, sample_inputs):
+    """Rate-limit errors should be re-raised after one attempt, without sleeping.
+
+    The whole-chapter retry in storycrew.main owns the budget for them.
+    """
+    class RateLimitError(Exception):
+        pass
+
+    with patch('storycrew.crews.chapter_crew.Crew') as mock_crew_class, \
+            patch('storycrew.crews.chapter_crew.time.sleep') as mock_sleep:
+        mock_crew_class.return_value.kickoff.side_effect = RateLimitError("429 Too Many Requests")
+
+        with pytest.raises(RateLimitError):
+            chapter_crew.generate_chapter(
+                chapter_number=1,
+                chapter_outline=sample_inputs["chapter_outline"],
+                story_bible=sample_inputs["story_bible_public"],
+                story_spec=sample_inputs["story_spec"]
+            )
+
+        assert mock_crew_class.return_value.kickoff.call_count == 1
+        mock_sleep.assert_not_called()
+
+
+def test_write_only_recovery_reuses_cached_scene_list(chapter_crew, sample_scene_list):
+    """WRITE_ONLY recovery should reuse the state's SceneList and store the normalized JSON."""
+    from storycrew.models import ChapterGenerationState
+
+    state = ChapterGenerationState()
+    state.set_scene_list(sample_scene_list)
+
+    normalized = chapter_crew._parse_and_normalize_scene_list(state)
+
+    assert normalized is sample_scene_list
+    assert sum(scene.target_words for scene in normalized.scenes) == 3000
+    assert state.get_scene_list() is normalized
+    stored = SceneList.model_validate_json(state.scene_list)
+    assert stored.scenes[0].target_words == 3000
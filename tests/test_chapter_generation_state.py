@@ -2,6 +2,7 @@
 import pytest
 from storycrew.models.chapter_generation_state import ChapterGenerationState
 from storycrew.models.retry_level import RetryLevel
+from storycrew.models.scene_list import SceneList, Scene
 
 def test_state_initialization():
     """State should initialize with default None values"""
@@ -82,3 +83,32 @@ def test_to_preserve_missing_scene_list():
     )
     preserved = state.to_preserve(RetryLevel.WRITE_ONLY)
     assert len(preserved) == 0
+
+def test_scene_list_construct_trusted_round_trip():
+    """construct_trusted should rebuild nested Scene objects, not plain dicts"""
+    original = SceneList(
+        chapter_number=3,
+        scenes=[{"scene_number": 1, "purpose": "开场", "target_words": 1500}]
+    )
+    rebuilt = SceneList.construct_trusted(original.model_dump_json())
+    assert isinstance(rebuilt.scenes[0], Scene)
+    assert rebuilt.scenes[0].purpose == "开场"
+    assert rebuilt.scenes[0].target_words == 1500
+    assert rebuilt.scenes[0].notes == []
+    assert rebuilt == original
+
+def test_set_scene_list_caches_json_and_object():
+    """set_scene_list should dump once and hand back the same SceneList object"""
+    scene_list = SceneList(chapter_number=1, scenes=[{"scene_number": 1, "purpose": "开场"}])
+    state = ChapterGenerationState()
+    state.set_scene_list(scene_list)
+    assert state.scene_list == scene_list.model_dump_json()
+    assert state.get_scene_list() is scene_list
+    assert state.to_preserve(RetryLevel.WRITE_ONLY)["scene_list"] is state.scene_list
+
+def test_get_scene_list_rebuilds_after_direct_assignment():
+    """Assigning scene_list directly should not return the stale cached object"""
+    state = ChapterGenerationState()
+    state.set_scene_list(SceneList(chapter_number=1))
+    state.scene_list = SceneList(chapter_number=2).model_dump_json()
+    assert state.get_scene_list().chapter_number == 2
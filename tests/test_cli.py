@@ -0,0 +1,55 @@
+"""Tests for the storycrew command-line entry point."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Runs _cli.main() with the given argv in a fresh interpreter and reports
+# which heavy modules ended up imported
+_PROBE = """
+import sys
+from storycrew import _cli
+sys.argv = ["storycrew", *sys.argv[1:]]
+try:
+    code = _cli.main()
+except SystemExit as exc:
+    code = exc.code
+loaded = sorted(name for name in ("storycrew.main", "crewai") if name in sys.modules)
+print("LOADED:" + ",".join(loaded))
+sys.exit(code or 0)
+"""
+
+
+def _run_cli(*args):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, "-c", _PROBE, *args],
+        capture_output=True, text=True, env=env, timeout=60
+    )
+
+@pytest.mark.parametrize("flag", ["--version", "-V"])
+def test_version_does_not_import_main(flag):
+    """--version should print the version without loading storycrew.main or CrewAI"""
+    proc = _run_cli(flag)
+    assert proc.returncode == 0
+    assert proc.stdout.startswith("storycrew ")
+    assert "LOADED:\n" in proc.stdout
+
+def test_help_does_not_import_main():
+    """--help should print usage without loading storycrew.main or CrewAI"""
+    proc = _run_cli("--help")
+    assert proc.returncode == 0
+    assert "--genre" in proc.stdout
+    assert "LOADED:\n" in proc.stdout
+
+def test_invalid_genre_does_not_import_main():
+    """Argument errors should exit before generation is loaded"""
+    proc = _run_cli("--genre", "horror", "--theme", "x")
+    assert proc.returncode == 2
+    assert "invalid choice" in proc.stderr
+    assert "LOADED:\n" in proc.stdout
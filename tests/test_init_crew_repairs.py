@@ -0,0 +1,70 @@
+"""Tests for the StoryBible JSON repair helpers in init_crew."""
+import pytest
+from storycrew.crews.init_crew import _ensure_character_fields, _salvage_partial_json
+
+
+def test_character_repair_removes_empty_and_corrupted_objects():
+    """Empty objects and small all-empty objects should be dropped from characters"""
+    data = {"characters": [
+        {"name": "林晚", "role": "protagonist"},
+        {},
+        {"name": "", "role": ""},
+        {"description": None},
+    ]}
+    assert _ensure_character_fields(data) is True
+    assert data["characters"] == [{"name": "林晚", "role": "protagonist"}]
+
+def test_character_repair_removes_timeline_events_and_non_dicts():
+    """TimelineEvent objects and non-dict entries mixed into characters should be removed"""
+    data = {"characters": [
+        {"chapter": 3, "scene": 2, "event": "案发"},
+        "林晚",
+        {"name": "周衡", "role": "antagonist"},
+    ]}
+    assert _ensure_character_fields(data) is True
+    assert data["characters"] == [{"name": "周衡", "role": "antagonist"}]
+
+def test_character_repair_fills_unknown_objects():
+    """Objects with content but no name/role should get placeholder values"""
+    data = {"characters": [{"description": "神秘访客", "motivation": "复仇", "age": 40}]}
+    assert _ensure_character_fields(data) is True
+    character = data["characters"][0]
+    assert character["name"] == "Unknown Character 0"
+    assert character["role"] == "supporting"
+    assert character["description"] == "神秘访客"
+
+@pytest.mark.parametrize("age, expected", [
+    ("28岁", 28),
+    ("不详", None),
+    (["28"], None),
+])
+def test_character_repair_coerces_age(age, expected):
+    """Age should become an int parsed from strings, or None when unusable"""
+    data = {"characters": [{"name": "林晚", "role": "protagonist", "age": age}]}
+    assert _ensure_character_fields(data) is True
+    assert data["characters"][0]["age"] == expected
+
+def test_character_repair_leaves_valid_data_unchanged():
+    """Valid characters should not be reported as changed"""
+    data = {"characters": [{"name": "林晚", "role": "protagonist", "age": 28}]}
+    assert _ensure_character_fields(data) is False
+    assert data["characters"][0]["age"] == 28
+
+def test_salvage_keeps_complete_characters_from_truncated_json():
+    """Truncated output should keep the complete objects and drop the broken tail"""
+    truncated = (
+        '{"characters": [{"name": "林晚", "role": "protagonist", "age": "28岁"}, '
+        '{"name": "周'
+    )
+    data = _salvage_partial_json(truncated)
+    assert data is not None
+    assert data["characters"][0] == {"name": "林晚", "role": "protagonist", "age": "28岁"}
+
+    # The half-written second character is left empty and removed by the repair
+    _ensure_character_fields(data)
+    assert data["characters"] == [{"name": "林晚", "role": "protagonist", "age": 28}]
+
+@pytest.mark.parametrize("broken", ["", "not json", "[1, 2", '"just a string"'])
+def test_salvage_returns_none_without_an_object(broken):
+    """Nothing to salvage should yield None so the caller moves on"""
+    assert _salvage_partial_json(broken) is None
@@ -0,0 +1,100 @@
+"""Tests for TPMWindowLimiter and the token totals that feed it."""
+from types import SimpleNamespace
+
+import pytest
+from storycrew.tools import rate_limiter
+from storycrew.tools.rate_limiter import TPMWindowLimiter
+
+
+class FakeClock:
+    """Stands in for time.monotonic / time.sleep inside rate_limiter"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=fake.monotonic, sleep=fake.sleep))
+    return fake
+
+
+def test_acquire_without_usage_does_not_wait(clock):
+    """Empty window should let the first chapter through immediately"""
+    limiter = TPMWindowLimiter(1000, headroom=1.0)
+    assert limiter.acquire(expected_tokens=5000) == 0
+    assert clock.sleeps == []
+
+def test_acquire_within_budget_does_not_wait(clock):
+    """Usage plus the estimate under the budget should not wait"""
+    limiter = TPMWindowLimiter(1000, headroom=1.0)
+    limiter.record(400)
+    assert limiter.acquire(expected_tokens=500) == 0
+
+def test_acquire_waits_until_window_edge(clock):
+    """Over budget should wait exactly until the oldest record expires"""
+    limiter = TPMWindowLimiter(1000, headroom=1.0)
+    limiter.record(800)
+    clock.now += 20
+    waited = limiter.acquire(expected_tokens=500)
+    assert waited == pytest.approx(40.0)
+    assert limiter.used == 0
+
+def test_acquire_frees_records_one_at_a_time(clock):
+    """Only as many records as needed should expire before passing"""
+    limiter = TPMWindowLimiter(1000, headroom=1.0)
+    limiter.record(600)
+    clock.now += 10
+    limiter.record(300)
+    waited = limiter.acquire(expected_tokens=500)
+    assert waited == pytest.approx(50.0)
+    assert limiter.used == 300
+
+def test_from_env_without_budget(monkeypatch):
+    """Unset or invalid budget should disable throttling"""
+    monkeypatch.delenv(rate_limiter.TPM_BUDGET_ENV, raising=False)
+    assert TPMWindowLimiter.from_env() is None
+    monkeypatch.setenv(rate_limiter.TPM_BUDGET_ENV, "abc")
+    assert TPMWindowLimiter.from_env() is None
+
+class StubLLM:
+    """Stands in for a crewai LLM instance cached in storycrew.crew"""
+
+    def __init__(self, prompt_tokens, completion_tokens):
+        self.usage = SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+    def get_token_usage_summary(self):
+        return self.usage
+
+
+def test_limiter_uses_llm_usage_summaries(clock, monkeypatch):
+    """Completion events carry only the text; the LLM usage summaries must feed the limiter"""
+    from storycrew import crew
+    from storycrew.listeners.llm_logging_listener import LLMLoggingListener
+
+    listener = LLMLoggingListener()
+    event = SimpleNamespace(
+        call_type="llm_call",
+        model="openai/gpt-4o-mini",
+        response="第一章\n\n夜色渐深。",
+    )
+    listener._on_call_completed(event)
+    assert listener.total_input_tokens + listener.total_output_tokens == 0
+
+    monkeypatch.setattr(crew, "_llm", StubLLM(600, 200))
+    monkeypatch.setattr(crew, "_outline_llm", None)
+    monkeypatch.setattr(crew, "_llm_cache", {"OPENAI_MODEL_JUDGE": StubLLM(150, 50)})
+    assert crew.get_token_usage_total() == 1000
+
+    limiter = TPMWindowLimiter(1000, headroom=1.0)
+    limiter.record(crew.get_token_usage_total())
+    assert limiter.acquire(expected_tokens=500) == pytest.approx(60.0)
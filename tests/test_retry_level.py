@@ -145,3 +145,10 @@ def test_determine_retry_level_unknown_issue():
     level = determine_retry_level(judge, attempt=0)
     # prose is known, so EDIT_ONLY
     assert level == RetryLevel.EDIT_ONLY
+
+def test_determine_retry_level_uses_worst_safety_severity():
+    """Any high/critical safety issue should win over a low one, in either order"""
+    low = Issue(type="safety", severity="low", note="轻微不当表述")
+    high = Issue(type="safety", severity="high", note="严重违规内容")
+    assert determine_retry_level(JudgeReport(issues=[low, high]), attempt=0) == RetryLevel.FULL_RETRY
+    assert determine_retry_level(JudgeReport(issues=[high, low]), attempt=0) == RetryLevel.FULL_RETRY
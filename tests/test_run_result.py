@@ -0,0 +1,26 @@
+"""Tests for the deprecated 'final_book' key of run()'s result."""
+import pytest
+from storycrew.main import _RunResult
+
+
+def test_final_book_is_read_from_file_with_warning(tmp_path):
+    """Both result['final_book'] and .get('final_book') should read the file and warn"""
+    book = tmp_path / "book_final.md"
+    book.write_text("第一章 正文", encoding="utf-8")
+    result = _RunResult({"final_book_file": str(book)})
+
+    with pytest.deprecated_call():
+        assert result["final_book"] == "第一章 正文"
+    with pytest.deprecated_call():
+        assert result.get("final_book") == "第一章 正文"
+    assert "final_book" not in result
+
+
+def test_other_keys_behave_like_dict():
+    """Missing keys should still raise or fall back to the default"""
+    result = _RunResult({"success": True})
+
+    assert result.get("success") is True
+    assert result.get("final_book", "default") == "default"
+    with pytest.raises(KeyError):
+        result["final_book"]